@@ -1,22 +1,29 @@
 """This module contains the implementation of abstract data type Binary Search Tree.
     |br| To achieve that, a Binary Search Tree node (BSTNode) class has been implemented as well.
+    |br| This module also contains a self-balancing (AVL) variant of the Binary Search Tree, and an ordered key-value map (TreeMap) built on it.
 """
+from collections import deque
+
 # -------------------------- Binary Search Tree ------------------------------
 
 
 class BSTNode:
     """This is the class implementation of node for binary search tree.
         |br| This node/object of this class has the property that it contains address of the left and right child of itself.
+        |br| It also caches the height (level) and the number of nodes (size) of the sub-tree rooted at itself, which the trees keep up to date.
+
+        |br| The attributes are declared in __slots__, so a node carries no per-instance __dict__, which keeps large trees compact.
 
         This class has one constructor and one convertor:
         
         - __init__(data) is the constructor, and
         - __str__() is the convertor.
     """
+    __slots__ = ('info', 'left', 'right', 'level', 'size')
     
     def __init__(self, info):
         """Constructor method for node of Binary Search Tree.
-        |br| This stores the given value(info) in info and sets the left, right and level to None.
+        |br| This stores the given value(info) in info, sets the left and right to None, and the level (height) and size of the single node sub-tree to 0 and 1.
 
         Example:
             >>> from BinarySearchTree import *
@@ -27,13 +34,14 @@ class BSTNode:
             None
             >>> print(sample.right)
             None
-            >>> print(sample.level)
-            None
+            >>> print(sample.level, sample.size)
+            0 1
         """
         self.info = info
         self.left = None
         self.right = None
-        self.level = None
+        self.level = 0
+        self.size = 1
     
     def __str__(self):
         """Convertor method for node of binary search tree.
@@ -50,17 +58,136 @@ class BSTNode:
         """
         return str(self.info)
 
+def _level(node):
+    """Returns the cached height of node, or -1 for an empty subtree."""
+    return node.level if node else -1
+
+def _size(node):
+    """Returns the cached number of nodes of the sub-tree rooted at node, or 0 for an empty subtree."""
+    return node.size if node else 0
+
+def _update(node):
+    """Recomputes the cached level and size of node from those of its children."""
+    left = node.left
+    right = node.right
+    if left and right:
+        node.level = 1 + (left.level if left.level > right.level else right.level)
+        node.size = 1 + left.size + right.size
+    elif left:
+        node.level = 1 + left.level
+        node.size = 1 + left.size
+    elif right:
+        node.level = 1 + right.level
+        node.size = 1 + right.size
+    else:
+        node.level = 0
+        node.size = 1
+
+def _build(keys, lo, hi):
+    """Returns the root of a balanced sub-tree holding the sorted keys[lo:hi], with the levels and sizes of its nodes set."""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = BSTNode(keys[mid])
+    node.left = _build(keys, lo, mid)
+    node.right = _build(keys, mid + 1, hi)
+    _update(node)
+    return node
+
+def _link(nodes, lo, hi):
+    """Relinks the in-order list of existing nodes[lo:hi] into a balanced sub-tree and returns its root."""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = nodes[mid]
+    node.left = _link(nodes, lo, mid)
+    node.right = _link(nodes, mid + 1, hi)
+    _update(node)
+    return node
+
+def _preorder(root):
+    """Yields the nodes of the sub-tree rooted at root in pre-order."""
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def _inorder(root):
+    """Yields the nodes of the sub-tree rooted at root in in-order."""
+    stack = []
+    node = root
+    while stack or node:
+        while node: # go down the left spine
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+def _postorder(root):
+    """Yields the nodes of the sub-tree rooted at root in post-order."""
+    stack = []
+    node = root
+    last = None # last node yielded
+    while stack or node:
+        while node: # go down the left spine
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right # right sub-tree not visited yet
+        else:
+            last = stack.pop()
+            yield last
+
+def _levelorder(root):
+    """Yields the nodes of the sub-tree rooted at root level by level."""
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
 class BinarySearchTree:
     """This is the class implementation of Binary Search Tree.
-       |br| An instance of this class represents a Binary Search Tree which supports insertion at a node, traversal of tree and finding height of a node.
+       |br| An instance of this class represents a Binary Search Tree which supports insertion and deletion of nodes, traversal of tree, finding height of a node, order statistics and ordered searches.
 
-        This class has four member functions of which one is a constructor:
+        This class has twenty three member functions of which one is a constructor, and two alternate constructors:
 
         - __init__() is the constructor
+        - from_sorted(values) builds a balanced tree from sorted values
+        - from_iterable(values) builds a balanced tree from any values
         - insert(val)
+        - delete(val)
+        - discard(val)
+        - delete_many(vals)
         - traverse(order)
+        - __iter__() iterates over the values in ascending order
+        - iter_preorder()
+        - iter_inorder()
+        - iter_postorder()
+        - iter_levelorder()
         - height(root)
+        - __len__() gives the number of values
+        - rank(x)
+        - select(k)
+        - contains(x), also available as the in operator
+        - min()
+        - max()
+        - floor(x)
+        - ceiling(x)
+        - successor(x)
+        - predecessor(x)
+        - range(lo, hi)
     """
+    _node_class = BSTNode # class of the nodes created by insert
     
     def __init__(self):
         """Constructor method for BST.
@@ -73,6 +200,57 @@ class BinarySearchTree:
             None
         """
         self.root = None
+
+    @classmethod
+    def from_sorted(cls, values):
+        """Builds a perfectly balanced tree from values given in ascending order in O(n), without inserting them one by one.
+        |br| Repeated values are stored only once.
+
+        :param values: Data to be stored in the tree, in ascending order
+        :type values: iterable
+        :return: a new tree containing the values
+        :rtype: BinarySearchTree
+        :raises ValueError: if the values are not in ascending order
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_sorted([1, 2, 2, 3, 4, 5, 6, 7])
+            >>> sample.traverse('PRE') # doctest: +NORMALIZE_WHITESPACE
+            4 2 1 3 6 5 7
+            >>> print(sample.height(sample.root))
+            2
+        """
+        keys = []
+        for val in values:
+            if keys and not keys[-1] < val:
+                if val < keys[-1]:
+                    raise ValueError('values are not in ascending order')
+                continue # value exists
+            keys.append(val)
+        tree = cls()
+        tree.root = _build(keys, 0, len(keys))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values):
+        """Builds a perfectly balanced tree from values given in any order, sorting them once.
+        |br| Repeated values are stored only once.
+
+        :param values: Data to be stored in the tree, must be of type considering comparison operator
+        :type values: iterable
+        :return: a new tree containing the values
+        :rtype: BinarySearchTree
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = AVLTree.from_iterable([7, 3, 5, 1, 3, 6, 2, 4])
+            >>> sample.traverse('IN') # doctest: +NORMALIZE_WHITESPACE
+            1 2 3 4 5 6 7
+            >>> sample.insert(8)
+            >>> print(sample.height(sample.root))
+            3
+        """
+        return cls.from_sorted(sorted(values))
     
     def insert(self, val):
         """Inserts a BST node with info as the value(val) given in the Binary Search Tree.
@@ -91,30 +269,61 @@ class BinarySearchTree:
             >>> print(sample.root.left.left, sample.root.left.right, sample.root.right.left, sample.root.right.right)
             None None None None
         """
+        self._insert(val)
+
+    def _insert(self, val):
+        """Returns the node holding val, creating and linking a new node if the value is not present, together with a flag telling if it was created."""
         if self.root == None:
-            self.root = BSTNode(val)
-        else:
-            current = self.root
-            while True:
-                if val < current.info: # move to left sub-tree
-                    if current.left:
-                        current = current.left # root moved
-                    else:
-                        current.left = BSTNode(val) # left init
-                        break
-                elif val > current.info: # move to right sub-tree
-                    if current.right:
-                        current = current.right # root moved
-                    else:
-                        current.right = BSTNode(val) # right init
-                        break
+            self.root = self._node_class(val)
+            return self.root, True
+        path = [] # nodes visited from the root
+        current = self.root
+        while True:
+            path.append(current)
+            if val < current.info: # move to left sub-tree
+                if current.left:
+                    current = current.left # root moved
+                else:
+                    node = current.left = self._node_class(val) # left init
+                    break
+            elif val > current.info: # move to right sub-tree
+                if current.right:
+                    current = current.right # root moved
+                else:
+                    node = current.right = self._node_class(val) # right init
+                    break
+            else:
+                return current, False # value exists
+        self._fixup(path, 1)
+        return node, True
+
+    def _fixup(self, path, delta):
+        """Walks a root-to-node path bottom up after delta nodes were added below it, refreshing the cached fields of every node on it through _rebalance and relinking any sub-tree root that changed."""
+        for i in range(len(path) - 1, -1, -1):
+            current = path[i]
+            level = current.level
+            subtree = self._rebalance(current)
+            if subtree is not current:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is current:
+                    path[i - 1].left = subtree
                 else:
-                    break # value exists
+                    path[i - 1].right = subtree
+            elif current.level == level: # heights above are unchanged
+                for j in range(i):
+                    path[j].size += delta
+                return
+
+    def _rebalance(self, node):
+        """Updates the cached level and size of node and returns the root of its sub-tree, which a plain BST never restructures."""
+        _update(node)
+        return node
     
     def traverse(self, order):
         """This prints the tree depending upon the traversal we want.
 
-        :param order: This is the type of traversal we want for the tree
+        :param order: This is the type of traversal we want for the tree, one of 'PRE', 'IN', 'POST' and 'LEVEL'
         :type order: str
 
         Example:
@@ -133,38 +342,212 @@ class BinarySearchTree:
             1 2 3 4 5 6 7
             >>> sample.traverse('POST')  # doctest: +NORMALIZE_WHITESPACE
             1 3 2 5 7 6 4
+            >>> sample.traverse('LEVEL')  # doctest: +NORMALIZE_WHITESPACE
+            4 2 6 1 3 5 7
+        """
+        orders = {'PRE': _preorder, 'IN': _inorder, 'POST': _postorder, 'LEVEL': _levelorder}
+        if order in orders:
+            for node in orders[order](self.root):
+                print(node.info, end = ' ')
+
+    def __iter__(self):
+        """Returns an iterator over the values of the tree in ascending (in-order) order.
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+            >>> print(list(sample))
+            [1, 2, 3, 4, 5, 6, 7]
+        """
+        return self.iter_inorder()
+
+    def iter_preorder(self):
+        """Lazily yields the values of the tree in pre-order, using an explicit stack of O(height) nodes.
+
+        :return: generator of the stored values
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+            >>> print(list(sample.iter_preorder()))
+            [4, 2, 1, 3, 6, 5, 7]
         """
-        def preOrder(root):
-            print(root.info, end = ' ')
-            if root.left != None:
-                preOrder(root.left)
-            if root.right != None:
-                preOrder(root.right)
-        def inOrder(root):
-            if root.left != None:
-                inOrder(root.left)
-            print(root.info, end = ' ')
-            if root.right != None:
-                inOrder(root.right)
-        def postOrder(root):
-            if root.left != None:
-                postOrder(root.left)
-            if root.right != None:
-                postOrder(root.right)
-            print(root.info, end = ' ')
-        if order == 'PRE':
-            preOrder(self.root)
-        elif order == 'IN':
-            inOrder(self.root)
-        elif order == 'POST':
-            postOrder(self.root)
+        return (node.info for node in _preorder(self.root))
+
+    def iter_inorder(self):
+        """Lazily yields the values of the tree in in-order (ascending), using an explicit stack of O(height) nodes.
+
+        :return: generator of the stored values
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree()
+            >>> for i in range(2000):
+            ...     sample.insert(i)
+            >>> print(sum(sample.iter_inorder()))
+            1999000
+        """
+        return (node.info for node in _inorder(self.root))
+
+    def iter_postorder(self):
+        """Lazily yields the values of the tree in post-order, using an explicit stack of O(height) nodes.
+
+        :return: generator of the stored values
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+            >>> print(list(sample.iter_postorder()))
+            [1, 3, 2, 5, 7, 6, 4]
+        """
+        return (node.info for node in _postorder(self.root))
+
+    def iter_levelorder(self):
+        """Lazily yields the values of the tree level by level, from the root down and left to right within a level.
+
+        :return: generator of the stored values
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+            >>> print(list(sample.iter_levelorder()))
+            [4, 2, 6, 1, 3, 5, 7]
+        """
+        return (node.info for node in _levelorder(self.root))
     
-    def height(self, root):
-        """This function gives the height of the tree traversing the tree from the root till the farthest leaf.
+    def delete(self, val):
+        """Deletes the BST node with info as the given value(val) from the tree in O(height).
+        |br| The removed node is unlinked from the tree completely, so no references to it or from it are left behind.
+
+        :param val: Data to be erased from the tree
+        :type val: any
+        :raises KeyError: if the value is not present in the tree
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([4, 2, 6, 1, 3, 5, 7])
+            >>> sample.delete(4)
+            >>> sample.delete(1)
+            >>> sample.traverse('PRE') # doctest: +NORMALIZE_WHITESPACE
+            5 2 3 6 7
+            >>> print(len(sample), sample.height())
+            5 2
+            >>> sample.delete(4)
+            Traceback (most recent call last):
+                ...
+            KeyError: 4
+        """
+        if not self.discard(val):
+            raise KeyError(val)
+
+    def discard(self, val):
+        """Deletes the BST node with info as the given value(val) from the tree if present, in O(height).
+
+        :param val: Data to be erased from the tree
+        :type val: any
+        :return: returns True if deleted successfully, else returns False if the value is not in the tree
+        :rtype: bool
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = AVLTree.from_iterable(range(10))
+            >>> print(sample.discard(3), sample.discard(3))
+            True False
+            >>> print([sample.discard(i) for i in range(7)])
+            [True, True, True, False, True, True, True]
+            >>> print(list(sample), sample.height())
+            [7, 8, 9] 1
+        """
+        path = [] # nodes visited from the root
+        current = self.root
+        while current:
+            if val < current.info:
+                path.append(current)
+                current = current.left
+            elif val > current.info:
+                path.append(current)
+                current = current.right
+            else:
+                break
+        else:
+            return False # value not found
+        fix = path # nodes whose sub-trees lost a node
+        if current.left and current.right: # replace by in-order successor
+            below = [] # nodes between current and its successor
+            successor = current.right
+            while successor.left:
+                below.append(successor)
+                successor = successor.left
+            if below:
+                below[-1].left = successor.right
+                successor.right = current.right
+            successor.left = current.left
+            successor.level = current.level # take over the cached fields of current
+            successor.size = current.size
+            replacement = successor
+            fix = path + [successor] + below
+        else:
+            replacement = current.left or current.right
+        if not path:
+            self.root = replacement
+        elif path[-1].left is current:
+            path[-1].left = replacement
+        else:
+            path[-1].right = replacement
+        current.left = current.right = None # release the removed node
+        self._fixup(fix, -1)
+        return True
 
-        :param root: denotes the starting node
-        :type root: BSTNode
-        :return: returns the distance of the node given from its farthest leaf
+    def delete_many(self, vals):
+        """Deletes all the given values that are present in the tree and returns how many were deleted.
+        |br| A short batch is deleted one value at a time in O(height) each. When the batch is large compared to the tree,
+        the tree is instead walked once in order alongside the sorted batch and the surviving nodes are relinked into a balanced tree in O(n + k).
+
+        :param vals: Data to be erased from the tree
+        :type vals: iterable
+        :return: number of values deleted
+        :rtype: int
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable(range(10))
+            >>> print(sample.delete_many([2, 3, 4, 5, 6, 42]))
+            5
+            >>> print(list(sample), sample.height())
+            [0, 1, 7, 8, 9] 2
+            >>> print(sample.delete_many([8]))
+            1
+        """
+        vals = sorted(vals)
+        if len(vals) * (self.height() + 1) <= len(self):
+            count = 0
+            for val in vals:
+                count += self.discard(val)
+            return count
+        kept = [] # surviving nodes in order
+        removed = 0
+        i = 0
+        for node in list(_inorder(self.root)):
+            while i < len(vals) and vals[i] < node.info:
+                i += 1
+            if i < len(vals) and not node.info < vals[i]: # value to be deleted
+                node.left = node.right = None # release the removed node
+                removed += 1
+            else:
+                kept.append(node)
+        self.root = _link(kept, 0, len(kept))
+        return removed
+
+    def height(self, root = None):
+        """This function gives the height of the tree from the given node till its farthest leaf, read in O(1) from the cached level of the node.
+
+        :param root: denotes the starting node, defaults to the root of the tree
+        :type root: BSTNode, optional
+        :return: returns the distance of the node given from its farthest leaf, or -1 for an empty tree
         :rtype: int
 
         Example:
@@ -179,12 +562,693 @@ class BinarySearchTree:
             >>> sample.insert(7)
             >>> print(sample.height(sample.root))
             2
+            >>> print(sample.height(), sample.height(sample.root.left.right), BinarySearchTree().height())
+            2 0 -1
+        """
+        if root == None:
+            root = self.root
+        return _level(root)
+
+    def __len__(self):
+        """Returns the number of values stored in the tree in O(1).
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree()
+            >>> sample.insert(4)
+            >>> sample.insert(2)
+            >>> sample.insert(4)
+            >>> print(len(sample))
+            2
+        """
+        return _size(self.root)
+
+    def rank(self, x):
+        """Counts the values in the tree that are smaller than x in O(height), using the cached sub-tree sizes.
+
+        :param x: value to be ranked, need not be present in the tree
+        :type x: any
+        :return: number of stored values smaller than x
+        :rtype: int
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30, 40, 50])
+            >>> print(sample.rank(10), sample.rank(35), sample.rank(50), sample.rank(99))
+            0 3 4 5
+        """
+        count = 0
+        current = self.root
+        while current:
+            if x < current.info:
+                current = current.left
+            elif x > current.info:
+                count += 1 + _size(current.left)
+                current = current.right
+            else:
+                return count + _size(current.left)
+        return count
+
+    def select(self, k):
+        """Returns the k-th smallest value of the tree (counting from 0) in O(height), using the cached sub-tree sizes.
+        |br| Negative k counts from the largest value, as in list indexing.
+
+        :param k: rank of the value required
+        :type k: int
+        :return: the value with exactly k smaller values in the tree
+        :rtype: any
+        :raises IndexError: if k is out of range
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30, 40, 50])
+            >>> print(sample.select(0), sample.select(3), sample.select(-1))
+            10 40 50
+            >>> print(sample.select(sample.rank(30)))
+            30
+        """
+        n = _size(self.root)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError('select index out of range')
+        current = self.root
+        while True:
+            left = _size(current.left)
+            if k < left:
+                current = current.left
+            elif k > left:
+                k -= left + 1
+                current = current.right
+            else:
+                return current.info
+
+    def contains(self, x):
+        """Checks if the value x is stored in the tree, in O(height).
+
+        :param x: value to be searched
+        :type x: any
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30])
+            >>> print(sample.contains(20), sample.contains(25))
+            True False
+            >>> print(30 in sample)
+            True
+        """
+        current = self.root
+        while current:
+            if x < current.info:
+                current = current.left
+            elif x > current.info:
+                current = current.right
+            else:
+                return True
+        return False
+
+    __contains__ = contains
+
+    def min(self):
+        """Returns the smallest value of the tree.
+
+        :return: the smallest value
+        :rtype: any
+        :raises ValueError: if the tree is empty
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([20, 10, 30])
+            >>> print(sample.min())
+            10
+        """
+        current = self.root
+        if current == None:
+            raise ValueError('min() of an empty tree')
+        while current.left:
+            current = current.left
+        return current.info
+
+    def max(self):
+        """Returns the largest value of the tree.
+
+        :return: the largest value
+        :rtype: any
+        :raises ValueError: if the tree is empty
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([20, 10, 30])
+            >>> print(sample.max())
+            30
+        """
+        current = self.root
+        if current == None:
+            raise ValueError('max() of an empty tree')
+        while current.right:
+            current = current.right
+        return current.info
+
+    def floor(self, x):
+        """Returns the largest value of the tree which is smaller than or equal to x.
+
+        :param x: the bound, need not be present in the tree
+        :type x: any
+        :return: the floor of x, or None if every value is larger than x
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30])
+            >>> print(sample.floor(20), sample.floor(25), sample.floor(5))
+            20 20 None
+        """
+        best = None
+        current = self.root
+        while current:
+            if x < current.info:
+                current = current.left
+            elif x > current.info:
+                best = current.info # candidate, look for a larger one
+                current = current.right
+            else:
+                return current.info
+        return best
+
+    def ceiling(self, x):
+        """Returns the smallest value of the tree which is larger than or equal to x.
+
+        :param x: the bound, need not be present in the tree
+        :type x: any
+        :return: the ceiling of x, or None if every value is smaller than x
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30])
+            >>> print(sample.ceiling(20), sample.ceiling(25), sample.ceiling(35))
+            20 30 None
+        """
+        best = None
+        current = self.root
+        while current:
+            if x > current.info:
+                current = current.right
+            elif x < current.info:
+                best = current.info # candidate, look for a smaller one
+                current = current.left
+            else:
+                return current.info
+        return best
+
+    def successor(self, x):
+        """Returns the smallest value of the tree which is strictly larger than x.
+
+        :param x: the bound, need not be present in the tree
+        :type x: any
+        :return: the successor of x, or None if there is none
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30])
+            >>> print(sample.successor(10), sample.successor(15), sample.successor(30))
+            20 20 None
+        """
+        best = None
+        current = self.root
+        while current:
+            if x < current.info:
+                best = current.info
+                current = current.left
+            else:
+                current = current.right
+        return best
+
+    def predecessor(self, x):
+        """Returns the largest value of the tree which is strictly smaller than x.
+
+        :param x: the bound, need not be present in the tree
+        :type x: any
+        :return: the predecessor of x, or None if there is none
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable([10, 20, 30])
+            >>> print(sample.predecessor(30), sample.predecessor(25), sample.predecessor(10))
+            20 20 None
+        """
+        best = None
+        current = self.root
+        while current:
+            if x > current.info:
+                best = current.info
+                current = current.right
+            else:
+                current = current.left
+        return best
+
+    def range(self, lo, hi):
+        """Lazily yields the values v of the tree with lo <= v <= hi in ascending order.
+        |br| Only the O(height + k) nodes on the way to the k values in the range are visited.
+
+        :param lo: lower bound (inclusive)
+        :type lo: any
+        :param hi: upper bound (inclusive)
+        :type hi: any
+        :return: generator of the values within the bounds
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = BinarySearchTree.from_iterable(range(0, 100, 10))
+            >>> print(list(sample.range(25, 60)))
+            [30, 40, 50, 60]
+            >>> print(list(sample.range(60, 25)))
+            []
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node: # go down the left spine, skipping sub-trees below lo
+                if node.info < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.info > hi:
+                return
+            yield node.info
+            node = node.right
+
+
+# ------------------------------- AVL Tree -----------------------------------
+
+class AVLTree(BinarySearchTree):
+    """This is the class implementation of a self-balancing (AVL) Binary Search Tree.
+       |br| An instance of this class behaves like a BinarySearchTree, but after every insertion or deletion the tree is rebalanced by rotations,
+       so that the heights of the two sub-trees of any node differ by at most one and the height of the tree stays O(log n) even for sorted input.
+
+        This class has the same member functions as BinarySearchTree, and it is also rebalanced after every deletion.
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = AVLTree()
+            >>> sample.insert(1)
+            >>> sample.insert(2)
+            >>> sample.insert(3)
+            >>> print(sample.root.info, sample.root.left.info, sample.root.right.info)
+            2 1 3
+            >>> for i in range(4, 1025):
+            ...     sample.insert(i)
+            >>> print(sample.height(), len(sample))
+            10 1024
+    """
+
+    def _rotate_left(self, node):
+        """Rotates the sub-tree rooted at node to the left and returns its new root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        _update(node)
+        _update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """Rotates the sub-tree rooted at node to the right and returns its new root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        _update(node)
+        _update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        """Updates the cached level and size of node, restores the AVL property at it and returns the root of its sub-tree."""
+        left = _level(node.left)
+        right = _level(node.right)
+        if left - right > 1: # left heavy
+            if _level(node.left.left) < _level(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if right - left > 1: # right heavy
+            if _level(node.right.right) < _level(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        _update(node)
+        return node
+
+
+# ------------------------------- Tree Map -----------------------------------
+
+class TreeMapNode(BSTNode):
+    """This is the class implementation of node for tree map.
+        |br| Besides the fields of a BSTNode, whose info holds the sort key, this node stores the original key and the value mapped to it.
+
+        This class has one constructor:
+
+        - __init__(info) is the constructor
+    """
+    __slots__ = ('key', 'value')
+
+    def __init__(self, info):
+        """Constructor method for node of Tree Map.
+        |br| This sets up the node like a BSTNode, sets the key to the given info and the value to None.
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMapNode('a')
+            >>> print(sample.info, sample.key, sample.value)
+            a a None
         """
-        if root.left == None and root.right == None:
-            return 0
-        elif root.right == None:
-            return 1 + self.height(root.left)
-        elif root.left == None:
-            return 1 + self.height(root.right)
+        BSTNode.__init__(self, info)
+        self.key = info
+        self.value = None
+
+_missing = object() # default marker of TreeMap.pop
+
+class TreeMap(AVLTree):
+    """This is the class implementation of an ordered key-value map on top of the AVL tree.
+       |br| An instance of this class maps keys to values like a dict, but keeps the keys in sorted order, so that iteration and items() give them in key order.
+       |br| An optional key function is computed once per key to give the sort key stored in the info of a node; two keys with equal sort keys are the same key of the map.
+       |br| The ordered member functions inherited from BinarySearchTree (min, max, floor, ceiling, successor, predecessor, range, rank, select, delete and friends) take and return sort keys,
+       which are the keys themselves when no key function is given.
+
+        This class has thirteen member functions of which one is a constructor, and two alternate constructors:
+
+        - __init__(items, key) is the constructor
+        - from_sorted(items, key) builds the map from items in key order
+        - from_iterable(items, key) builds the map from items in any order
+        - insert(val) adds a key with the value None
+        - __getitem__(k)
+        - __setitem__(k, v)
+        - __delitem__(k)
+        - __contains__(k)
+        - __iter__() iterates over the keys in order
+        - get(k, default)
+        - setdefault(k, default)
+        - pop(k, default)
+        - keys()
+        - values()
+        - items()
+
+    :param key: This is the key function, or None to order the keys by themselves
+    :type key: function
+    """
+    _node_class = TreeMapNode
+
+    def __init__(self, items = None, key = None):
+        """Constructor method for Tree Map.
+        |br| This stores the key function and fills the map with the given items, building a balanced tree after sorting them once.
+        When a key occurs several times in the items, the last value wins, as in a dict.
+
+        :param items: a mapping or (key, value) pairs to fill the map with, defaults to None
+        :type items: dict or iterable, optional
+        :param key: function giving the sort key of a key, defaults to None
+        :type key: function, optional
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({'pear': 3, 'apple': 1, 'fig': 2})
+            >>> print(list(sample.items()))
+            [('apple', 1), ('fig', 2), ('pear', 3)]
+            >>> sample = TreeMap([('b', 1), ('A', 2), ('a', 3)], key = str.lower)
+            >>> print(list(sample.items()))
+            [('A', 3), ('b', 1)]
+        """
+        AVLTree.__init__(self)
+        self.key = key
+        if items == None:
+            return
+        if hasattr(items, 'items'):
+            items = items.items()
+        if key == None:
+            pairs = sorted(items, key = lambda item: item[0])
         else:
-            return 1 + max(self.height(root.left),self.height(root.right))
\ No newline at end of file
+            pairs = sorted(((key(k), k, v) for k, v in items), key = lambda item: item[0])
+        nodes = []
+        for pair in pairs:
+            info = pair[0]
+            if nodes and not nodes[-1].info < info: # key exists
+                nodes[-1].value = pair[-1]
+                continue
+            node = TreeMapNode(info)
+            node.key = pair[-2]
+            node.value = pair[-1]
+            nodes.append(node)
+        self.root = _link(nodes, 0, len(nodes))
+
+    @classmethod
+    def from_sorted(cls, items, key = None):
+        """Builds a map from (key, value) pairs given in key order.
+
+        :param items: a mapping or (key, value) pairs
+        :type items: dict or iterable
+        :param key: function giving the sort key of a key, defaults to None
+        :type key: function, optional
+        :return: a new map holding the items
+        :rtype: TreeMap
+        """
+        return cls(items, key)
+
+    @classmethod
+    def from_iterable(cls, items, key = None):
+        """Builds a map from (key, value) pairs given in any order.
+
+        :param items: a mapping or (key, value) pairs
+        :type items: dict or iterable
+        :param key: function giving the sort key of a key, defaults to None
+        :type key: function, optional
+        :return: a new map holding the items
+        :rtype: TreeMap
+        """
+        return cls(items, key)
+
+    def _find(self, k):
+        """Returns the node of the key k, or None if k is not in the map."""
+        info = k if self.key == None else self.key(k)
+        current = self.root
+        while current:
+            if info < current.info:
+                current = current.left
+            elif info > current.info:
+                current = current.right
+            else:
+                return current
+        return None
+
+    def _node(self, k):
+        """Returns the node of the key k, creating it with the value None if k is not in the map, together with a flag telling if it was created."""
+        if self.key == None:
+            return self._insert(k)
+        node, created = self._insert(self.key(k))
+        if created:
+            node.key = k
+        return node, created
+
+    def insert(self, val):
+        """Adds the key val to the map with the value None, unless it is already present.
+
+        :param val: key to be added
+        :type val: any
+        """
+        self._node(val)
+
+    def __getitem__(self, k):
+        """Returns the value mapped to the key k in O(log n).
+
+        :param k: the key
+        :type k: any
+        :return: the value of k
+        :rtype: any
+        :raises KeyError: if k is not in the map
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({'a': 1})
+            >>> print(sample['a'])
+            1
+            >>> sample['b']
+            Traceback (most recent call last):
+                ...
+            KeyError: 'b'
+        """
+        node = self._find(k)
+        if node == None:
+            raise KeyError(k)
+        return node.value
+
+    def __setitem__(self, k, v):
+        """Maps the key k to the value v in O(log n), replacing any previous value of k.
+
+        :param k: the key
+        :type k: any
+        :param v: the value
+        :type v: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap()
+            >>> sample[3] = 'c'
+            >>> sample[1] = 'a'
+            >>> sample[3] = 'C'
+            >>> print(list(sample.items()), len(sample))
+            [(1, 'a'), (3, 'C')] 2
+        """
+        self._node(k)[0].value = v
+
+    def __delitem__(self, k):
+        """Removes the key k and its value from the map in O(log n).
+
+        :param k: the key
+        :type k: any
+        :raises KeyError: if k is not in the map
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({1: 'a', 2: 'b'})
+            >>> del sample[1]
+            >>> print(list(sample))
+            [2]
+        """
+        if not self.discard(k if self.key == None else self.key(k)):
+            raise KeyError(k)
+
+    def __contains__(self, k):
+        """Checks if the key k is in the map.
+
+        :param k: the key
+        :type k: any
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({'Key': 1}, key = str.lower)
+            >>> print('KEY' in sample, 'lock' in sample)
+            True False
+        """
+        return self._find(k) != None
+
+    def __iter__(self):
+        """Returns an iterator over the keys of the map in key order.
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({2: 'b', 1: 'a'})
+            >>> print(list(sample))
+            [1, 2]
+        """
+        return (node.key for node in _inorder(self.root))
+
+    def get(self, k, default = None):
+        """Returns the value mapped to the key k, or default if k is not in the map.
+
+        :param k: the key
+        :type k: any
+        :param default: value returned for a missing key, defaults to None
+        :type default: any, optional
+        :return: the value of k or default
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({'a': 1})
+            >>> print(sample.get('a'), sample.get('b'), sample.get('b', 0))
+            1 None 0
+        """
+        node = self._find(k)
+        if node == None:
+            return default
+        return node.value
+
+    def setdefault(self, k, default = None):
+        """Returns the value mapped to the key k, first mapping k to default if k is not in the map, with a single descent of the tree.
+
+        :param k: the key
+        :type k: any
+        :param default: value stored for a missing key, defaults to None
+        :type default: any, optional
+        :return: the value of k
+        :rtype: any
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap()
+            >>> sample.setdefault('a', []).append(1)
+            >>> sample.setdefault('a', []).append(2)
+            >>> print(sample['a'])
+            [1, 2]
+        """
+        node, created = self._node(k)
+        if created:
+            node.value = default
+        return node.value
+
+    def pop(self, k, default = _missing):
+        """Removes the key k from the map and returns its value.
+
+        :param k: the key
+        :type k: any
+        :param default: value returned for a missing key
+        :type default: any, optional
+        :return: the value of k, or default
+        :rtype: any
+        :raises KeyError: if k is not in the map and no default is given
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({'a': 1})
+            >>> print(sample.pop('a'), sample.pop('a', None), len(sample))
+            1 None 0
+        """
+        node = self._find(k)
+        if node == None:
+            if default is _missing:
+                raise KeyError(k)
+            return default
+        value = node.value
+        self.discard(node.info)
+        return value
+
+    def keys(self):
+        """Returns an iterator over the keys of the map in key order.
+
+        :return: generator of the keys
+        :rtype: generator
+        """
+        return iter(self)
+
+    def values(self):
+        """Returns an iterator over the values of the map in key order.
+
+        :return: generator of the values
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({2: 'b', 1: 'a'})
+            >>> print(list(sample.values()))
+            ['a', 'b']
+        """
+        return (node.value for node in _inorder(self.root))
+
+    def items(self):
+        """Returns an iterator over the (key, value) pairs of the map in key order.
+
+        :return: generator of the pairs
+        :rtype: generator
+
+        Example:
+            >>> from BinarySearchTree import *
+            >>> sample = TreeMap({2: 'b', 1: 'a'})
+            >>> print(list(sample.items()))
+            [(1, 'a'), (2, 'b')]
+        """
+        return ((node.key, node.value) for node in _inorder(self.root))
@@ -0,0 +1,374 @@
+"""This module contains the implementation of least recently used (LRU) and least frequently used (LFU) caches.
+    |br| Both caches keep a dictionary from every key to its node in a Doubly linked list (DoublyLinkedList), so get and put are O(1).
+    |br| This module also contains a cached decorator useful for memoizing a function with either cache.
+"""
+import functools
+
+from DoublyLinkedList import DoublyLinkedList
+
+_missing = object() # marks a missing key
+_kwmark = object() # separates positional from keyword arguments in a key
+
+# ------------------------------------ Cache -----------------------------------
+
+
+class _Cache:
+    """This is the common implementation of the LRU and LFU caches.
+        |br| Every entry is kept as the list [key, value, weight] (LFU adds its count of uses) in the data of a node, and the subclasses decide which node is evicted.
+    """
+
+    def __init__(self, maxsize = 128, maxweight = None, weigher = None, on_evict = None):
+        if maxsize != None and maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.on_evict = on_evict
+        self.index = {}
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default = None):
+        """Returns the value stored for key and marks it as used, or returns default if the key is not cached.
+
+        :param key: the key to look up
+        :type key: hashable
+        :param default: the value returned for a missing key, defaults to None
+        :type default: any, optional
+        :return: the cached value, or default
+        :rtype: any
+        """
+        node = self.index.get(key)
+        if node == None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.index[key] = self._touch(node)
+        return node.data[1]
+
+    def put(self, key, value):
+        """Stores value for key and marks it as used.
+        |br| A new key first evicts entries until it fits within the bounds, and an updated key evicts other entries until it fits,
+        so the key being stored is never evicted by its own put; a cache with maxsize 0 stores nothing.
+
+        :param key: the key to store the value for
+        :type key: hashable
+        :param value: the value to store
+        :type value: any
+        :raises ValueError: if the weight of value alone is larger than maxweight
+        """
+        weight = self._weigh(key, value)
+        if self.maxweight != None and weight > self.maxweight:
+            raise ValueError('value is heavier than maxweight')
+        node = self.index.get(key)
+        if node == None:
+            if self.maxsize == 0:
+                return
+            self._evict(1, weight) # make room first
+            self.index[key] = self._add([key, value, weight])
+            self.weight += weight
+        else: # replace the value in place
+            entry = node.data
+            self.weight += weight - entry[2]
+            entry[1] = value
+            entry[2] = weight
+            node = self.index[key] = self._touch(node)
+            self._evict(0, 0, node) # evict the others first
+
+    def pop(self, key, default = _missing):
+        """Removes key from the cache and returns its value, without counting an eviction.
+
+        :param key: the key to remove
+        :type key: hashable
+        :param default: the value returned for a missing key
+        :type default: any, optional
+        :return: the removed value, or default
+        :rtype: any
+        :raises KeyError: if the key is not cached and no default is given
+        """
+        node = self.index.pop(key, None)
+        if node == None:
+            if default is _missing:
+                raise KeyError(key)
+            return default
+        entry = node.data
+        self._remove(node)
+        self.weight -= entry[2]
+        return entry[1]
+
+    def __contains__(self, key):
+        """Checks if key is cached, without marking it as used or counting a hit or miss."""
+        return key in self.index
+
+    def __len__(self):
+        """Returns the number of cached entries."""
+        return len(self.index)
+
+    def _weigh(self, key, value):
+        """Returns the weight of an entry, 1 if the cache has no weigher."""
+        return self.weigher(key, value) if self.weigher != None else 1
+
+    def _evict(self, count, weight, keep = None):
+        """Evicts entries other than the node keep until count more entries of the given total weight fit within maxsize and maxweight."""
+        index = self.index
+        while (self.maxsize != None and len(index) + count > self.maxsize) or (self.maxweight != None and self.weight + weight > self.maxweight):
+            node = self._victim(keep)
+            key, value, size = node.data[:3]
+            self._remove(node)
+            del index[key]
+            self.weight -= size
+            self.evictions += 1
+            if self.on_evict != None:
+                self.on_evict(key, value)
+
+class LRUCache(_Cache):
+    """This is the class implementation of a least recently used cache.
+        |br| The entries are kept in a Doubly linked list from the most to the least recently used, so a hit moves its node to the head and an eviction pops the tail.
+
+        This class has six member functions of which one is a constructor:
+
+        - __init__(maxsize, maxweight, weigher, on_evict) is the constructor
+        - get(key, default)
+        - put(key, value)
+        - pop(key, default)
+        - __contains__(key)
+        - __len__()
+
+    :param maxsize: This contains the largest number of entries kept, or None for no bound on the number
+    :type maxsize: int
+    :param maxweight: This contains the largest total weight of the entries kept, or None for no bound on the weight
+    :type maxweight: int
+    :param weigher: This returns the weight of an entry from its key and value, or is None to weigh every entry as 1
+    :type weigher: function
+    :param on_evict: This is called with the key and value of every evicted entry, or is None
+    :type on_evict: function
+    :param index: This maps every key to the node of its entry
+    :type index: dict
+    :param order: This contains the nodes of the entries from the most to the least recently used
+    :type order: DoublyLinkedList
+    :param weight: This contains the total weight of the entries
+    :type weight: int
+    :param hits: This contains the number of gets which found their key
+    :type hits: int
+    :param misses: This contains the number of gets which did not find their key
+    :type misses: int
+    :param evictions: This contains the number of entries evicted to stay within the bounds
+    :type evictions: int
+
+    Example:
+        >>> from Cache import *
+        >>> evicted = []
+        >>> sample = LRUCache(maxsize = 2, on_evict = lambda key, value: evicted.append(key))
+        >>> sample.put('a', 1)
+        >>> sample.put('b', 2)
+        >>> print(sample.get('a'))
+        1
+        >>> sample.put('c', 3)
+        >>> print(evicted, 'b' in sample, len(sample))
+        ['b'] False 2
+        >>> print(sample.get('b'), sample.hits, sample.misses, sample.evictions)
+        None 1 1 1
+        >>> sized = LRUCache(maxsize = None, maxweight = 10, weigher = lambda key, value: len(value))
+        >>> sized.put('a', 'xxxx')
+        >>> sized.put('b', 'yyyyyy')
+        >>> sized.put('c', 'z')
+        >>> print(sorted(sized.index), sized.weight)
+        ['b', 'c'] 7
+    """
+
+    def __init__(self, maxsize = 128, maxweight = None, weigher = None, on_evict = None):
+        """Constructor method for LRU cache.
+        |br| This sets the bounds, the weigher and the eviction callback, an empty index and order, and all the counters to zero.
+
+        :param maxsize: largest number of entries kept, defaults to 128; None means no bound on the number
+        :type maxsize: int, optional
+        :param maxweight: largest total weight of the entries kept, defaults to None for no bound on the weight
+        :type maxweight: int, optional
+        :param weigher: returns the weight of an entry from its key and value, defaults to None to weigh every entry as 1
+        :type weigher: function, optional
+        :param on_evict: called with the key and value of every evicted entry, defaults to None
+        :type on_evict: function, optional
+        :raises ValueError: if maxsize is negative
+
+        Example:
+            >>> from Cache import *
+            >>> sample = LRUCache()
+            >>> print(sample.maxsize, sample.maxweight, len(sample), sample.order.head)
+            128 None 0 None
+        """
+        _Cache.__init__(self, maxsize, maxweight, weigher, on_evict)
+        self.order = DoublyLinkedList()
+
+    def _add(self, entry):
+        """Puts a new entry at the head of the order and returns its node."""
+        return self.order.appendleft(entry)
+
+    def _touch(self, node):
+        """Moves the node of a used entry to the head of the order and returns it."""
+        self.order.move_to_front(node)
+        return node
+
+    def _remove(self, node):
+        """Unlinks the node of an entry from the order."""
+        self.order.remove_node(node)
+
+    def _victim(self, keep):
+        """Returns the node of the least recently used entry other than keep."""
+        node = self.order.tail
+        return node.prev if node is keep else node
+
+class LFUCache(_Cache):
+    """This is the class implementation of a least frequently used cache.
+        |br| The entries used the same number of times share one Doubly linked list, from the most to the least recently used,
+        so a hit moves its entry to the list of the next count and an eviction pops the tail of the list with the smallest count.
+        The lists are themselves kept in a Doubly linked list in increasing order of count, so the smallest count is always at its head and every step is O(1).
+
+        This class has six member functions of which one is a constructor:
+
+        - __init__(maxsize, maxweight, weigher, on_evict) is the constructor
+        - get(key, default)
+        - put(key, value)
+        - pop(key, default)
+        - __contains__(key)
+        - __len__()
+
+    The bounds, the weigher, the eviction callback, the index, the weight and the counters are the same as those of LRUCache.
+
+    :param counts: This contains a node for every count of uses, in increasing order, whose data is the count and the list of the nodes of entries used that many times
+    :type counts: DoublyLinkedList
+    :param buckets: This maps every count of uses to its node in counts
+    :type buckets: dict
+
+    Example:
+        >>> from Cache import *
+        >>> sample = LFUCache(maxsize = 2)
+        >>> sample.put('a', 1)
+        >>> sample.put('b', 2)
+        >>> print(sample.get('a'), sample.get('a'), sample.get('b'))
+        1 1 2
+        >>> sample.put('c', 3)
+        >>> print('a' in sample, 'b' in sample, 'c' in sample)
+        True False True
+        >>> sized = LFUCache(maxsize = None, maxweight = 10, weigher = lambda key, value: value)
+        >>> sized.put('a', 5)
+        >>> print(sized.get('a'), sized.get('a'))
+        5 5
+        >>> sized.put('b', 4)
+        >>> sized.put('b', 6)
+        >>> print(sorted(sized.index), sized.weight)
+        ['b'] 6
+    """
+
+    def __init__(self, maxsize = 128, maxweight = None, weigher = None, on_evict = None):
+        """Constructor method for LFU cache.
+        |br| This sets the bounds, the weigher and the eviction callback, an empty index and no counts, and all the counters to zero.
+
+        :param maxsize: largest number of entries kept, defaults to 128; None means no bound on the number
+        :type maxsize: int, optional
+        :param maxweight: largest total weight of the entries kept, defaults to None for no bound on the weight
+        :type maxweight: int, optional
+        :param weigher: returns the weight of an entry from its key and value, defaults to None to weigh every entry as 1
+        :type weigher: function, optional
+        :param on_evict: called with the key and value of every evicted entry, defaults to None
+        :type on_evict: function, optional
+        :raises ValueError: if maxsize is negative
+
+        Example:
+            >>> from Cache import *
+            >>> sample = LFUCache()
+            >>> print(sample.maxsize, sample.buckets, len(sample.counts))
+            128 {} 0
+        """
+        _Cache.__init__(self, maxsize, maxweight, weigher, on_evict)
+        self.counts = DoublyLinkedList()
+        self.buckets = {}
+
+    def _add(self, entry):
+        """Puts a new entry, used once, at the head of the bucket of count one and returns its node."""
+        entry.append(1)
+        bucket = self.buckets.get(1)
+        if bucket == None: # one is the smallest count
+            bucket = self.buckets[1] = self.counts.appendleft([1, DoublyLinkedList()])
+        return bucket.data[1].appendleft(entry)
+
+    def _touch(self, node):
+        """Moves a used entry to the head of the bucket of its next count and returns its new node."""
+        entry = node.data
+        count = entry[3]
+        bucket = self.buckets[count]
+        after = self.buckets.get(count + 1)
+        if after == None: # the next count goes right behind this one
+            after = self.buckets[count + 1] = self.counts.insert_after(bucket, [count + 1, DoublyLinkedList()])
+        self._remove(node)
+        entry[3] = count + 1
+        return after.data[1].appendleft(entry)
+
+    def _remove(self, node):
+        """Unlinks the node of an entry from its bucket, dropping the bucket once it is empty."""
+        count = node.data[3]
+        bucket = self.buckets[count]
+        entries = bucket.data[1]
+        entries.remove_node(node)
+        if entries.n == 0:
+            self.counts.remove_node(bucket)
+            del self.buckets[count]
+
+    def _victim(self, keep):
+        """Returns the node of the least recently used entry among those used the least number of times, other than keep."""
+        bucket = self.counts.head
+        node = bucket.data[1].tail
+        if node is keep: # the next one in its bucket, or the oldest of the next count
+            node = node.prev if node.prev != None else bucket.next.data[1].tail
+        return node
+
+def cached(cache = None):
+    """Decorator which memoizes a function in the given cache, keyed by its positional and keyword arguments.
+    |br| The cache is available as the cache attribute of the decorated function.
+    Without a cache every decorated function gets an LRUCache of its own; a given cache may be shared by several functions, so the function is then made part of the key.
+    A result heavier than the maxweight of the cache is returned without being cached.
+
+    :param cache: the cache to use, defaults to None for a new LRUCache of 128 entries per function
+    :type cache: LRUCache or LFUCache, optional
+    :return: the decorator
+    :rtype: function
+
+    Example:
+        >>> from Cache import *
+        >>> @cached(LRUCache(maxsize = 32))
+        ... def fib(n):
+        ...     return n if n < 2 else fib(n - 1) + fib(n - 2)
+        >>> print(fib(30), fib.cache.hits, fib.cache.misses)
+        832040 28 31
+        >>> memo = cached()
+        >>> g = memo(lambda x: ('g', x))
+        >>> h = memo(lambda x: ('h', x))
+        >>> print(g(1), h(1), g.cache is h.cache)
+        ('g', 1) ('h', 1) False
+        >>> shared = cached(LRUCache())
+        >>> g = shared(lambda x: ('g', x))
+        >>> h = shared(lambda x: ('h', x))
+        >>> print(g(1), h(1), len(g.cache))
+        ('g', 1) ('h', 1) 2
+        >>> @cached(LRUCache(maxweight = 5, weigher = lambda key, value: len(value)))
+        ... def word(n):
+        ...     return 'x' * n
+        >>> print(word(10), len(word.cache), word(3), len(word.cache))
+        xxxxxxxxxx 0 xxx 1
+    """
+    def decorator(func):
+        store = LRUCache() if cache == None else cache
+        prefix = () if cache == None else (func,) # tells apart the functions sharing the cache
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = prefix + args + (_kwmark,) + tuple(kwargs.items()) if kwargs else prefix + args
+            value = store.get(key, _missing)
+            if value is _missing:
+                value = func(*args, **kwargs)
+                if store.maxweight == None or store._weigh(key, value) <= store.maxweight: # skip results too heavy to cache
+                    store.put(key, value)
+            return value
+        wrapper.cache = store
+        return wrapper
+    return decorator
@@ -4,7 +4,10 @@
 
     * Singly Linked list
     * Doubly Linked list
+    * Unrolled Linked list
     * Binary Search Tree
     * Suffix Trie
+    * Suffix Automaton
     * Heap
+    * LRU and LFU Cache
 """
\ No newline at end of file
@@ -1,17 +1,22 @@
 """This module contains the implementation of abstract data type Doubly Linked List.
     |br| To achieve that, a Doubly Linked List node (DoublyLinkedListNode) class has been implemented as well.
+    |br| This module also contains a cursor (DoublyLinkedListCursor) class useful for walking and editing a list from a position which stays valid across edits.
 """
+import weakref
+
 # ------------------------------ Doubly Linked List ----------------------------
 
 class DoublyLinkedListNode:
     """This is the class implementation of node for doubly linked list.
         |br| This node/object of this class has the property that it contains address of the next as well as the previous node in the list.
+        |br| The attributes are declared in __slots__, so a node carries no per-instance __dict__.
 
         This class has one constructor and one convertor:
 
         - __init__(data) is the constructor, and
         - __str__() is the convertor.
     """
+    __slots__ = ('data', 'next', 'prev')
     
     def __init__(self, data):
         """Constructor method for node of Doubly linked list.
@@ -51,17 +56,40 @@ class DoublyLinkedList:
         |br| The objects of this class are doubly linked lists of whom the address of both the head and the tail are known and, 
         each node has the address of both the next and previous nodes.
 
-        This class has four member functions of which one is a constructor:
+        |br| Every insertion returns the new node, which can later be handed to insert_after, insert_before or remove_node to work on it in O(1) without a search.
+        |br| reverse only flips the direction in which the list is read, in O(1). While the list is flipped, it reads from the tail to the head through the prev links,
+        and every operation works on that order; materialize relinks the nodes so that the head and next links follow the order again.
+
+        This class has sixteen member functions of which one is a constructor:
 
         - __init__() is the constructor
         - insert(data)
+        - appendleft(data)
+        - insert_after(node, data)
+        - insert_before(node, data)
+        - pop()
+        - popleft()
+        - remove_node(node)
+        - move_to_front(node)
         - printer(sep)
         - reverse() 
+        - materialize()
+        - __len__()
+        - __iter__()
+        - __reversed__()
+        - cursor(node)
+
+    :param n: This contains the number of nodes in the list
+    :type n: int
+    :param flipped: This tells if the list is read from the tail to the head
+    :type flipped: bool
+    :param cursors: This contains the cursors open on the list, or is None if no cursor has been opened
+    :type cursors: weakref.WeakSet
     """
     
     def __init__(self):
         """Constructor method for doubly linked list.
-        |br| This sets the head and tail of the list to None.
+        |br| This sets the head and tail of the list to None, the number of nodes to zero and the list to be read from the head.
 
         Example:
             >>> from DoublyLinkedList import *
@@ -70,37 +98,254 @@ class DoublyLinkedList:
             None
             >>> print(sample.tail)
             None
+            >>> print(sample.n, sample.flipped)
+            0 False
         """
         self.head = None
         self.tail = None
+        self.n = 0
+        self.flipped = False
+        self.cursors = None
     
     def insert(self, data):
-        """Inserts a new node which contains given data behind the tail of the list.
+        """Inserts a new node which contains given data behind the last node of the list.
 
         :param data: It is the information to be stored in the linked list.
         :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
 
         Example:
             >>> from DoublyLinkedList import *
             >>> sample = DoublyLinkedList()
-            >>> sample.insert(10)
-            >>> sample.insert("11")
-            >>> sample.insert(22.5)
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> node = sample.insert(22.5)
             >>> print(sample.head.data, sample.head.next.data, sample.head.prev)
             10 11 None
             >>> print(sample.tail.data, sample.tail.next, sample.tail.prev.data)
             22.5 None 11
+            >>> print(node is sample.tail, sample.n)
+            True 3
         """
-        node = DoublyLinkedListNode(data) # new node
-        if not self.head: # no head
+        if self.flipped:
+            return self._link(DoublyLinkedListNode(data), None, self.head)
+        return self._link(DoublyLinkedListNode(data), self.tail, None)
+
+    def appendleft(self, data):
+        """Inserts a new node which contains given data in front of the first node of the list.
+
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.appendleft("11")
+            >>> sample.printer()
+            [11, 10]
+            >>> print(node is sample.head, node.prev)
+            True None
+        """
+        if self.flipped:
+            return self._link(DoublyLinkedListNode(data), self.tail, None)
+        return self._link(DoublyLinkedListNode(data), None, self.head)
+
+    def insert_after(self, node, data):
+        """Inserts a new node which contains given data right behind the given node of this list in O(1).
+
+        :param node: a node of this list
+        :type node: DoublyLinkedListNode
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> first = sample.insert(10)
+            >>> last = sample.insert(22.5)
+            >>> node = sample.insert_after(first, "11")
+            >>> node = sample.insert_after(last, 33)
+            >>> sample.printer()
+            [10, 11, 22.5, 33]
+            >>> print(node is sample.tail)
+            True
+        """
+        if self.flipped:
+            return self._link(DoublyLinkedListNode(data), node.prev, node)
+        return self._link(DoublyLinkedListNode(data), node, node.next)
+
+    def insert_before(self, node, data):
+        """Inserts a new node which contains given data right in front of the given node of this list in O(1).
+
+        :param node: a node of this list
+        :type node: DoublyLinkedListNode
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> first = sample.insert(10)
+            >>> last = sample.insert(22.5)
+            >>> node = sample.insert_before(last, "11")
+            >>> node = sample.insert_before(first, 0)
+            >>> sample.printer()
+            [0, 10, 11, 22.5]
+            >>> print(node is sample.head)
+            True
+        """
+        if self.flipped:
+            return self._link(DoublyLinkedListNode(data), node, node.next)
+        return self._link(DoublyLinkedListNode(data), node.prev, node)
+
+    def pop(self):
+        """Removes the last node of the list and returns its data.
+
+        :return: data of the removed node
+        :rtype: any
+        :raises IndexError: if the list is empty
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(sample.pop(), sample.pop(), sample.n)
+            11 10 0
+            >>> sample.pop()
+            Traceback (most recent call last):
+            ...
+            IndexError: pop from an empty list
+        """
+        if self.tail == None:
+            raise IndexError('pop from an empty list')
+        return self._remove(self.head if self.flipped else self.tail)
+
+    def popleft(self):
+        """Removes the first node of the list and returns its data.
+
+        :return: data of the removed node
+        :rtype: any
+        :raises IndexError: if the list is empty
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(sample.popleft(), sample.popleft(), sample.n)
+            10 11 0
+            >>> sample.popleft()
+            Traceback (most recent call last):
+            ...
+            IndexError: pop from an empty list
+        """
+        if self.head == None:
+            raise IndexError('pop from an empty list')
+        return self._remove(self.tail if self.flipped else self.head)
+
+    def remove_node(self, node):
+        """Unlinks the given node of this list in O(1) and returns its data.
+        |br| The node must belong to this list and must not have been removed already, which is not checked.
+        A cursor on the node moves to the node after it.
+
+        :param node: a node of this list
+        :type node: DoublyLinkedListNode
+        :return: data of the removed node
+        :rtype: any
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> middle = sample.insert("11")
+            >>> node = sample.insert(22.5)
+            >>> print(sample.remove_node(middle))
+            11
+            >>> sample.printer()
+            [10, 22.5]
+            >>> print(middle.prev, middle.next, sample.n)
+            None None 2
+        """
+        return self._remove(node)
+
+    def move_to_front(self, node):
+        """Moves the given node of this list in front of the first node in O(1), keeping the node itself.
+
+        :param node: a node of this list
+        :type node: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> node = sample.insert(22.5)
+            >>> sample.move_to_front(node)
+            >>> sample.printer()
+            [22.5, 10, 11]
+            >>> print(sample.head is node, sample.tail.data, sample.n)
+            True 11 3
+        """
+        if self.flipped:
+            if node is not self.tail:
+                self._unlink(node)
+                self._link(node, self.tail, None)
+        elif node is not self.head:
+            self._unlink(node)
+            self._link(node, None, self.head)
+
+    def _link(self, node, prev, next):
+        """Links the node in between the nodes prev and next, either of which is None at an end of the list, and returns it."""
+        node.prev = prev
+        node.next = next
+        if prev == None: # new head
             self.head = node
         else:
-            self.tail.next = node # add behind tail
-            node.prev = self.tail
-        self.tail = node # move tail
+            prev.next = node
+        if next == None: # new tail
+            self.tail = node
+        else:
+            next.prev = node
+        self.n += 1
+        return node
+
+    def _remove(self, node):
+        """Moves the cursors on the node to the node after it, then unlinks the node and returns its data."""
+        if self.cursors:
+            after = node.prev if self.flipped else node.next
+            for cursor in self.cursors:
+                if cursor.node is node:
+                    cursor.node = after
+        return self._unlink(node)
+
+    def _unlink(self, node):
+        """Unlinks the node from the list, clears its links and returns its data."""
+        prev = node.prev
+        next = node.next
+        if prev == None:
+            self.head = next
+        else:
+            prev.next = next
+        if next == None:
+            self.tail = prev
+        else:
+            next.prev = prev
+        node.prev = node.next = None # release the node
+        self.n -= 1
+        return node.data
     
     def printer(self, sep = ', '):
         """Prints the linked list.
+        |br| The whole list is joined into one string first, so it is written with a single print call.
 
         :param sep: This tells us what should be used as a separator for distinct elements while printing the list, defaults to ', '
         :type sep: str, optional
@@ -108,38 +353,59 @@ class DoublyLinkedList:
         Example:
             >>> from DoublyLinkedList import *
             >>> sample = DoublyLinkedList()
-            >>> sample.insert(10)
-            >>> sample.insert("11")
-            >>> sample.insert(22.5)
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> node = sample.insert(22.5)
             >>> sample.printer()
             [10, 11, 22.5]
             >>> sample.printer('<-> ')
             [10<-> 11<-> 22.5]
         """
-        ptr = self.head
-        print('[', end = '')
-        while ptr != None:
-            print(ptr, end = '')
-            ptr = ptr.next
-            if ptr != None:
-                print(sep, end = '')
-        print(']')
+        print('[' + sep.join(map(str, self)) + ']')
     
     def reverse(self):
-        """Reverses the linked list.
+        """Reverses the linked list in O(1) by flipping the direction in which it is read, without touching the nodes.
 
         Example:
             >>> from DoublyLinkedList import *
             >>> sample = DoublyLinkedList()
-            >>> sample.insert(10)
-            >>> sample.insert("11")
-            >>> sample.insert(22.5)
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> node = sample.insert(22.5)
             >>> sample.printer()
             [10, 11, 22.5]
             >>> sample.reverse()
             >>> sample.printer()
             [22.5, 11, 10]
+            >>> node = sample.insert(0)
+            >>> print(sample.popleft(), sample.flipped)
+            22.5 True
+            >>> sample.printer()
+            [11, 10, 0]
+        """
+        self.flipped = not self.flipped
+
+    def materialize(self):
+        """Relinks the nodes of a flipped list in place, so that it is read from the head through the next links again.
+        |br| This is the only O(n) step of a reversal, and does nothing if the list is not flipped.
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> node = sample.insert(22.5)
+            >>> sample.reverse()
+            >>> print(sample.head.data, sample.flipped)
+            10 True
+            >>> sample.materialize()
+            >>> print(sample.head.data, sample.head.next.data, sample.flipped)
+            22.5 11 False
+            >>> sample.printer()
+            [22.5, 11, 10]
         """
+        if not self.flipped:
+            return
         head = self.head # head pointer
         prev = None # previous pointer
         while head != None: # new node left
@@ -151,4 +417,250 @@ class DoublyLinkedList:
             prev = head # move pointer to previous element
             head = newHead # use saved pointer to move head
         self.tail = self.head
-        self.head = prev
\ No newline at end of file
+        self.head = prev
+        self.flipped = False
+
+    def __len__(self):
+        """Returns the number of nodes in the list in O(1).
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(len(sample))
+            2
+        """
+        return self.n
+
+    def __iter__(self):
+        """Returns a generator over the data of the nodes from the first to the last node.
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(list(sample))
+            [10, '11']
+            >>> sample.reverse()
+            >>> print(list(sample))
+            ['11', 10]
+        """
+        if self.flipped:
+            ptr = self.tail
+            while ptr != None:
+                yield ptr.data
+                ptr = ptr.prev
+        else:
+            ptr = self.head
+            while ptr != None:
+                yield ptr.data
+                ptr = ptr.next
+
+    def __reversed__(self):
+        """Returns a generator over the data of the nodes from the last to the first node, following the prev links.
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(list(reversed(sample)))
+            ['11', 10]
+        """
+        if self.flipped:
+            ptr = self.head
+            while ptr != None:
+                yield ptr.data
+                ptr = ptr.next
+        else:
+            ptr = self.tail
+            while ptr != None:
+                yield ptr.data
+                ptr = ptr.prev
+
+    def cursor(self, node = None):
+        """Opens a cursor on the given node of this list, or on the first node if none is given.
+
+        :param node: a node of this list, defaults to None for the first node
+        :type node: DoublyLinkedListNode, optional
+        :return: the new cursor
+        :rtype: DoublyLinkedListCursor
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> print(sample.cursor().node, sample.cursor(node).node)
+            10 11
+        """
+        if node == None:
+            node = self.tail if self.flipped else self.head
+        cursor = DoublyLinkedListCursor(self, node)
+        if self.cursors == None:
+            self.cursors = weakref.WeakSet()
+        self.cursors.add(cursor)
+        return cursor
+
+class DoublyLinkedListCursor:
+    """This is the class implementation of a cursor on a doubly linked list.
+        |br| A cursor sits on a node of its list, or on the gap (node None) which joins the last node back to the first.
+        It moves both ways in O(1) and inserts or deletes at its position; when its node is removed in any way, it moves to the node after it, so it stays valid across edits.
+
+        This class has six member functions of which one is a constructor:
+
+        - __init__(lst, node) is the constructor
+        - forward()
+        - back()
+        - insert_after(data)
+        - insert_before(data)
+        - delete()
+
+    :param lst: This is the list the cursor walks
+    :type lst: DoublyLinkedList
+    :param node: This is the node the cursor is on, or None for the gap
+    :type node: DoublyLinkedListNode
+    """
+    __slots__ = ('lst', 'node', '__weakref__')
+
+    def __init__(self, lst, node):
+        """Constructor method for cursors.
+        |br| This sets the list and the node of the cursor; DoublyLinkedList.cursor should be used instead, so that the list can move the cursor.
+
+        :param lst: the list to walk
+        :type lst: DoublyLinkedList
+        :param node: the node to start on, or None for the gap
+        :type node: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> cursor = sample.cursor()
+            >>> print(cursor.lst is sample, cursor.node)
+            True None
+        """
+        self.lst = lst
+        self.node = node
+
+    def forward(self):
+        """Moves the cursor to the next node, from the last node to the gap and from the gap to the first node, and returns the new node.
+
+        :return: the node the cursor is now on, or None for the gap
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> cursor = sample.cursor()
+            >>> print(cursor.forward(), cursor.forward(), cursor.forward())
+            11 None 10
+        """
+        lst = self.lst
+        if self.node == None:
+            self.node = lst.tail if lst.flipped else lst.head
+        else:
+            self.node = self.node.prev if lst.flipped else self.node.next
+        return self.node
+
+    def back(self):
+        """Moves the cursor to the previous node, from the first node to the gap and from the gap to the last node, and returns the new node.
+
+        :return: the node the cursor is now on, or None for the gap
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> node = sample.insert("11")
+            >>> cursor = sample.cursor()
+            >>> print(cursor.back(), cursor.back(), cursor.back())
+            None 11 10
+        """
+        lst = self.lst
+        if self.node == None:
+            self.node = lst.head if lst.flipped else lst.tail
+        else:
+            self.node = self.node.next if lst.flipped else self.node.prev
+        return self.node
+
+    def insert_after(self, data):
+        """Inserts a new node which contains given data right after the cursor, or as the first node if the cursor is on the gap.
+        |br| The cursor stays where it is.
+
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> cursor = sample.cursor()
+            >>> node = cursor.insert_after(11)
+            >>> print(cursor.forward(), cursor.forward())
+            11 None
+            >>> node = cursor.insert_after(9)
+            >>> sample.printer()
+            [9, 10, 11]
+        """
+        if self.node == None:
+            return self.lst.appendleft(data)
+        return self.lst.insert_after(self.node, data)
+
+    def insert_before(self, data):
+        """Inserts a new node which contains given data right before the cursor, or as the last node if the cursor is on the gap.
+        |br| The cursor stays where it is.
+
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+        :return: the new node
+        :rtype: DoublyLinkedListNode
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> node = sample.insert(10)
+            >>> cursor = sample.cursor()
+            >>> node = cursor.insert_before(9)
+            >>> print(cursor.back(), cursor.back())
+            9 None
+            >>> node = cursor.insert_before(11)
+            >>> sample.printer()
+            [9, 10, 11]
+        """
+        if self.node == None:
+            return self.lst.insert(data)
+        return self.lst.insert_before(self.node, data)
+
+    def delete(self):
+        """Removes the node the cursor is on and returns its data; the cursor moves to the next node.
+
+        :return: data of the removed node
+        :rtype: any
+        :raises IndexError: if the cursor is on the gap
+
+        Example:
+            >>> from DoublyLinkedList import *
+            >>> sample = DoublyLinkedList()
+            >>> for value in [10, 11, 22.5]:
+            ...     node = sample.insert(value)
+            >>> cursor = sample.cursor()
+            >>> other = sample.cursor(sample.head.next)
+            >>> print(cursor.forward(), cursor.delete(), cursor.node, other.node)
+            11 11 22.5 22.5
+            >>> print(cursor.delete(), cursor.node)
+            22.5 None
+            >>> cursor.delete()
+            Traceback (most recent call last):
+            ...
+            IndexError: cursor is on the gap
+        """
+        if self.node == None:
+            raise IndexError('cursor is on the gap')
+        return self.lst.remove_node(self.node)
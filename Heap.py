@@ -1,13 +1,26 @@
 """This module contains the implementation of abstract data type Heap.
+    |br| This module also contains a d-ary heap with key functions and a max-heap mode (DaryHeap),
+    and an indexed priority queue (IndexedHeap) whose elements can be located through handles (HeapHandle), both built on it.
+    |br| It also contains a thread-safe (ConcurrentHeap) and an asyncio (AsyncHeap) priority queue that wrap any of these heaps,
+    and the heap based functions nlargest, nsmallest and kmerge.
 """
+import asyncio
+import operator
+import queue
+import threading
+from collections import deque
+
 # --------------------------------- Heap --------------------------------
 
 class Heap:
     """This class is the implementation of the abstract datatype Heap.
 
-    This class has eight member functions of which one is the constructor:
+    The list grows automatically when an element is inserted into a full heap, so cap is only the number of slots allocated up front.
+
+    This class has eleven member functions of which one is the constructor, and one alternate constructor:
 
     - __init__(cap) is the constructor
+    - from_iterable(values) builds a heap from the given values
     - parent(i)
     - left(i)
     - right(i)
@@ -15,18 +28,24 @@ class Heap:
     - min()
     - Heapify(root)
     - deleteMin()
+    - pop()
+    - pop_many(k)
+    - push_many(values)
 
     :param H: This is the list whose elements are arranged in the form of a heap
     :type H: List
     :param n: This contains the number of elements in the heap
     :type n: int
-    :param M: This contains the capacity of the heap
+    :param M: This contains the number of slots allocated in H, the current capacity of the heap
     :type M: int
     """
-    def __init__(self, cap):
+    def __init__(self, cap = 0):
         """Constructor method for heap.
         |br| This initialises a list of size cap with all elements as None, sets the value of n to zero and value of M to cap.
 
+        :param cap: number of slots to allocate up front, defaults to 0
+        :type cap: int, optional
+
         Example:
             >>> from Heap import *
             >>> sample = Heap(3)
@@ -40,6 +59,30 @@ class Heap:
         self.H = [None]*cap
         self.n = 0
         self.M = cap
+
+    @classmethod
+    def from_iterable(cls, values):
+        """Builds a heap holding the given values by bottom-up heapification in O(n), instead of n insertions.
+
+        :param values: the values to be stored in the heap
+        :type values: iterable
+        :return: a new heap holding the values
+        :rtype: Heap
+
+        Example:
+            >>> from Heap import *
+            >>> sample = Heap.from_iterable([5, 3, 4, 1, 2])
+            >>> print(sample.H, sample.n, sample.M)
+            [1, 2, 4, 3, 5] 5 5
+            >>> print(sample.min())
+            1
+        """
+        heap = cls()
+        heap.H = list(values)
+        heap.n = heap.M = len(heap.H)
+        for i in range(heap.n // 2 - 1, -1, -1): # every node with a child, bottom up
+            heap.Heapify(i)
+        return heap
     
     def parent(self, i):
         """This returns the index of the parent of the element(in the heap) at the given index.
@@ -106,6 +149,7 @@ class Heap:
     
     def insert(self, val):
         """Inserts the element with value(= val) in the heap.
+        |br| If the heap is full, H is extended by one slot, which takes amortized O(1) time.
         
         :param val: the value to be inserted
         :type val: int
@@ -120,14 +164,30 @@ class Heap:
             >>> sample.insert(2)
             >>> print(sample.H)
             [1, 2, 4, 5, 3]
+            >>> sample.insert(0)
+            >>> print(sample.H, sample.n, sample.M)
+            [0, 2, 1, 5, 3, 4] 6 6
         """
-        if self.n != self.M:
+        if self.n == self.M: # full, grow
+            self.H.append(val)
+            self.M += 1
+        else:
             self.H[self.n] = val
-            i = self.n
-            self.n += 1
-            while i != 0 and self.H[self.parent(i)] > self.H[i]:
-                self.H[i], self.H[self.parent(i)] = self.H[self.parent(i)], self.H[i]
-                i = self.parent(i)
+        self.n += 1
+        self._siftUp(self.n - 1)
+
+    def _siftUp(self, i):
+        """Moves the element at index i up until its parent is not larger, shifting the larger parents down instead of swapping at every level."""
+        H = self.H
+        val = H[i]
+        while i != 0:
+            p = (i - 1) >> 1 # parent
+            if H[p] > val:
+                H[i] = H[p]
+                i = p
+            else:
+                break
+        H[i] = val
     
     def min(self):
         """Returns the minimum element of the heap.
@@ -152,23 +212,30 @@ class Heap:
     
     def Heapify(self, root):
         """Establishes the basic properties of the heap in the heap.
+        |br| The element at root is moved down iteratively, shifting the smaller children up instead of swapping at every level.
 
         :param root: index of the root element of the heap to be heapified
         :type root: int
         """
-        l = self.left(root)
-        r = self.right(root)
-        s = root
-        if (l < self.n and self.H[l] < self.H[root]):
-            s = l
-        if (r < self.n and self.H[r] < self.H[s]):
-            s = r
-        if s != root:
-            self.H[root], self.H[s] = self.H[s], self.H[root]
-            self.Heapify(s)
+        H = self.H
+        n = self.n
+        val = H[root]
+        i = root
+        l = 2 * i + 1
+        while l < n:
+            if l + 1 < n and H[l + 1] < H[l]: # right child is smaller
+                l += 1
+            if H[l] < val:
+                H[i] = H[l]
+                i = l
+                l = 2 * i + 1
+            else:
+                break
+        H[i] = val
     
     def deleteMin(self):
         """Deletes the minimum element of the heap and heapifies it.
+        |br| The slot of the last element is cleared but kept allocated, so later insertions can reuse it.
 
         Example:
             >>> from Heap import *
@@ -180,14 +247,1010 @@ class Heap:
             >>> sample.insert(2)
             >>> sample.deleteMin()
             >>> print(sample.H)
-            [2, 3, 4, 5]
+            [2, 3, 4, 5, None]
+            >>> sample.insert(6)
+            >>> sample.insert(0)
+            >>> print(sample.H, sample.M)
+            [0, 3, 2, 5, 6, 4] 6
         """
         if self.n > 0:
-            if self.n == 1:
-                self.H = []
-                self.n = 0
+            self.pop()
+
+    def pop(self):
+        """Deletes the minimum element of the heap and returns it.
+
+        :return: The minimum element of the heap
+        :rtype: any
+        :raises IndexError: if the heap is empty
+
+        Example:
+            >>> from Heap import *
+            >>> sample = Heap.from_iterable([5, 3, 4])
+            >>> print(sample.pop(), sample.pop(), sample.pop())
+            3 4 5
+            >>> sample.pop()
+            Traceback (most recent call last):
+                ...
+            IndexError: pop from an empty heap
+        """
+        if self.n == 0:
+            raise IndexError('pop from an empty heap')
+        H = self.H
+        top = H[0]
+        self.n -= 1
+        H[0] = H[self.n]
+        H[self.n] = None # release the last slot
+        if self.n:
+            self.Heapify(0)
+        return top
+
+    def pop_many(self, k):
+        """Deletes the k smallest elements of the heap (or all of them if there are fewer) and returns them in ascending order.
+        |br| If all the elements are requested, they are sorted at once instead of being popped one by one.
+
+        :param k: number of elements to remove
+        :type k: int
+        :return: the removed elements in ascending order
+        :rtype: List
+
+        Example:
+            >>> from Heap import *
+            >>> sample = Heap.from_iterable([5, 3, 4, 1, 2])
+            >>> print(sample.pop_many(2), sample.n)
+            [1, 2] 3
+            >>> print(sample.pop_many(10), sample.n)
+            [3, 4, 5] 0
+        """
+        n = self.n
+        if k >= n: # drain
+            out = sorted(self.H[:n])
+            self.H[:n] = [None] * n
+            self.n = 0
+            return out
+        pop = self.pop
+        return [pop() for _ in range(k)]
+
+    def push_many(self, values):
+        """Inserts all the given values in the heap.
+        |br| A batch that is large compared to the heap is appended as a whole and the heap is rebuilt bottom up in O(n + k), otherwise the values are sifted up one by one.
+
+        :param values: the values to be inserted
+        :type values: iterable
+
+        Example:
+            >>> from Heap import *
+            >>> sample = Heap()
+            >>> sample.insert(3)
+            >>> sample.push_many([5, 1, 4, 2])
+            >>> print(sample.pop_many(5))
+            [1, 2, 3, 4, 5]
+        """
+        values = list(values)
+        k = len(values)
+        n = self.n
+        H = self.H
+        H[n:] = values # also drops the free slots
+        self.n = self.M = n + k
+        if k * (n + k).bit_length() > n + k: # rebuilding is cheaper
+            for i in range((n + k) // 2 - 1, -1, -1):
+                self.Heapify(i)
+        else:
+            siftUp = self._siftUp
+            for i in range(n, n + k):
+                siftUp(i)
+
+
+# -------------------------------- D-ary Heap ---------------------------------
+
+class DaryHeap(Heap):
+    """This class is the implementation of a d-ary heap with an optional key function and a max-heap mode, on top of Heap.
+    |br| Every element has d children instead of two, so the tree is only log_d(n) levels deep, which makes insertions cheaper.
+    |br| The key of every element is computed once, when it is inserted, and kept in the list K alongside H. With reverse set, the element with the largest key is at the top.
+
+    This class has the same member functions as Heap, where min(), pop() and deleteMin() refer to the top element, that is the largest one of a max-heap.
+
+    :param d: This contains the number of children of every element
+    :type d: int
+    :param K: This is the list holding the key of the element at the same index of H
+    :type K: List
+    :param key: This is the key function, or None to compare the elements themselves
+    :type key: function
+    :param reverse: This tells if the heap is a max-heap
+    :type reverse: bool
+    """
+
+    def __init__(self, cap = 0, d = 2, key = None, reverse = False):
+        """Constructor method for d-ary heap.
+        |br| This sets up the heap like Heap, with the list K of the same size, and stores the arity, key function and order.
+
+        :param cap: number of slots to allocate up front, defaults to 0
+        :type cap: int, optional
+        :param d: number of children of every element, defaults to 2
+        :type d: int, optional
+        :param key: function giving the key of an element, defaults to None
+        :type key: function, optional
+        :param reverse: True for a max-heap, defaults to False
+        :type reverse: bool, optional
+        :raises ValueError: if d is smaller than 2
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap(4, d = 4, key = len, reverse = True)
+            >>> for word in ['fig', 'banana', 'kiwi', 'apple', 'plum']:
+            ...     sample.insert(word)
+            >>> print(sample.pop_many(5))
+            ['banana', 'apple', 'kiwi', 'plum', 'fig']
+        """
+        if d < 2:
+            raise ValueError('arity must be at least 2')
+        Heap.__init__(self, cap)
+        self.K = [None]*cap
+        self.d = d
+        self.key = key
+        self.reverse = reverse
+        self._before = operator.gt if reverse else operator.lt # tells if a key belongs above another
+
+    @classmethod
+    def from_iterable(cls, values, d = 2, key = None, reverse = False):
+        """Builds a d-ary heap holding the given values by bottom-up heapification in O(n).
+
+        :param values: the values to be stored in the heap
+        :type values: iterable
+        :param d: number of children of every element, defaults to 2
+        :type d: int, optional
+        :param key: function giving the key of an element, defaults to None
+        :type key: function, optional
+        :param reverse: True for a max-heap, defaults to False
+        :type reverse: bool, optional
+        :return: a new heap holding the values
+        :rtype: DaryHeap
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap.from_iterable([5, 3, 9, 1], d = 3, reverse = True)
+            >>> print(sample.min(), sample.n)
+            9 4
+        """
+        heap = cls(0, d, key, reverse)
+        heap.push_many(values)
+        return heap
+
+    def parent(self, i):
+        """This returns the index of the parent of the element(in the heap) at the given index.
+
+        :param i: it is the index of the element whose parent's index is required to be returned
+        :type i: int
+        :return: Index of the parent of the element(in the heap) at the given index
+        :rtype: int
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap(d = 4)
+            >>> print(sample.parent(1), sample.parent(4), sample.parent(5))
+            0 0 1
+        """
+        return (i - 1) // self.d
+
+    def left(self, i):
+        """This returns the index of the first (leftmost) child of the element(in the heap) at the given index.
+
+        :param i: it is the index of the element
+        :type i: int
+        :return: Index of the first child of the element(in the heap) at the given index
+        :rtype: int
+        """
+        return self.d * i + 1
+
+    def right(self, i):
+        """This returns the index of the last (rightmost) child of the element(in the heap) at the given index.
+
+        :param i: it is the index of the element
+        :type i: int
+        :return: Index of the last child of the element(in the heap) at the given index
+        :rtype: int
+        """
+        return self.d * (i + 1)
+
+    def insert(self, val):
+        """Inserts the element with value(= val) in the heap, computing its key once.
+
+        :param val: the value to be inserted
+        :type val: any
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap(d = 3, key = abs)
+            >>> sample.insert(-5)
+            >>> sample.insert(2)
+            >>> print(sample.H, sample.K)
+            [2, -5] [2, 5]
+        """
+        k = val if self.key == None else self.key(val)
+        if self.n == self.M: # full, grow
+            self.H.append(val)
+            self.K.append(k)
+            self.M += 1
+        else:
+            self.H[self.n] = val
+            self.K[self.n] = k
+        self.n += 1
+        self._siftUp(self.n - 1)
+
+    def push_many(self, values):
+        """Inserts all the given values in the heap, computing the key of each once.
+
+        :param values: the values to be inserted
+        :type values: iterable
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap(d = 8, reverse = True)
+            >>> sample.push_many(range(100))
+            >>> print(sample.pop_many(3))
+            [99, 98, 97]
+        """
+        values = list(values)
+        keys = values if self.key == None else [self.key(val) for val in values]
+        k = len(values)
+        n = self.n
+        self.H[n:] = values # also drops the free slots
+        self.K[n:] = keys
+        self.n = self.M = n + k
+        if k * (n + k).bit_length() > n + k: # rebuilding is cheaper
+            for i in range((n + k - 2) // self.d, -1, -1): # every node with a child, bottom up
+                self.Heapify(i)
+        else:
+            for i in range(n, n + k):
+                self._siftUp(i)
+
+    def pop(self):
+        """Deletes the top element of the heap and returns it.
+
+        :return: The top element of the heap
+        :rtype: any
+        :raises IndexError: if the heap is empty
+
+        Example:
+            >>> from Heap import *
+            >>> sample = DaryHeap.from_iterable(['bb', 'a', 'ccc'], key = len)
+            >>> print(sample.pop(), sample.pop())
+            a bb
+        """
+        if self.n == 0:
+            raise IndexError('pop from an empty heap')
+        H = self.H
+        K = self.K
+        top = H[0]
+        self.n -= 1
+        H[0] = H[self.n]
+        K[0] = K[self.n]
+        H[self.n] = K[self.n] = None # release the last slot
+        if self.n:
+            self.Heapify(0)
+        return top
+
+    def pop_many(self, k):
+        """Deletes the k top elements of the heap (or all of them if there are fewer) and returns them in order.
+        |br| If all the elements are requested, they are sorted by key at once instead of being popped one by one.
+
+        :param k: number of elements to remove
+        :type k: int
+        :return: the removed elements, top first
+        :rtype: List
+        """
+        n = self.n
+        if k >= n: # drain
+            H = self.H
+            order = sorted(range(n), key = self.K.__getitem__, reverse = self.reverse)
+            out = [H[i] for i in order]
+            self.H[:n] = self.K[:n] = [None] * n
+            self.n = 0
+            return out
+        pop = self.pop
+        return [pop() for _ in range(k)]
+
+    def _siftUp(self, i):
+        """Moves the element at index i up until its parent belongs above it, moving the key along with it."""
+        H = self.H
+        K = self.K
+        d = self.d
+        before = self._before
+        val = H[i]
+        k = K[i]
+        while i != 0:
+            p = (i - 1) // d # parent
+            if before(k, K[p]):
+                H[i] = H[p]
+                K[i] = K[p]
+                i = p
+            else:
+                break
+        H[i] = val
+        K[i] = k
+
+    def Heapify(self, root):
+        """Establishes the basic properties of the heap in the heap, by moving the element at root down past its d children.
+
+        :param root: index of the root element of the heap to be heapified
+        :type root: int
+        """
+        H = self.H
+        K = self.K
+        n = self.n
+        d = self.d
+        before = self._before
+        val = H[root]
+        k = K[root]
+        i = root
+        c = d * i + 1 # first child
+        while c < n:
+            best = c
+            bestKey = K[c]
+            for j in range(c + 1, min(c + d, n)): # pick the child that belongs on top
+                if before(K[j], bestKey):
+                    best = j
+                    bestKey = K[j]
+            if before(bestKey, k):
+                H[i] = H[best]
+                K[i] = bestKey
+                i = best
+                c = d * i + 1
             else:
-                self.n -= 1
-                self.H[0] = self.H[self.n]
-                self.H.pop()
-                self.Heapify(0)
\ No newline at end of file
+                break
+        H[i] = val
+        K[i] = k
+
+
+# ------------------------------- Indexed Heap --------------------------------
+
+class HeapHandle:
+    """This is the class implementation of a handle to an element of an indexed heap.
+    |br| A handle stores the item, its priority and the current index of the handle in the list of the heap, which the heap keeps up to date.
+
+    This class has one constructor and one comparison function:
+
+    - __init__(item, priority) is the constructor, and
+    - __lt__(other) compares the priorities.
+    """
+    __slots__ = ('item', 'priority', 'index')
+
+    def __init__(self, item, priority):
+        """Constructor method for heap handles.
+        |br| This stores the item and its priority, and sets the index to None as the handle is not in a heap yet.
+
+        Example:
+            >>> from Heap import *
+            >>> sample = HeapHandle('job', 3)
+            >>> print(sample.item, sample.priority, sample.index)
+            job 3 None
+        """
+        self.item = item
+        self.priority = priority
+        self.index = None
+
+    def __lt__(self, other):
+        """Comparison method for heap handles, ordering them by priority.
+
+        Example:
+            >>> from Heap import *
+            >>> print(HeapHandle('a', 1) < HeapHandle('b', 2))
+            True
+        """
+        return self.priority < other.priority
+
+class IndexedHeap(Heap):
+    """This class is the implementation of an indexed priority queue on top of Heap.
+    |br| The list H holds a HeapHandle for every element, and every move of a handle inside H updates its index,
+    so that a handle can be found in O(1) and its priority changed or the handle removed in O(log n).
+
+    This class has ten member functions of its own, and the rest of the member functions of Heap:
+
+    - insert(val) pushes val with itself as the priority
+    - push(item, priority)
+    - push_many(pairs)
+    - pop()
+    - pop_many(k)
+    - decrease_key(handle, priority)
+    - update(handle, priority)
+    - remove(handle)
+    - __contains__(handle)
+    - from_iterable(pairs) builds a heap from (item, priority) pairs
+    """
+
+    @classmethod
+    def from_iterable(cls, pairs):
+        """Builds an indexed heap holding the given (item, priority) pairs by bottom-up heapification in O(n).
+
+        :param pairs: the (item, priority) pairs to be stored in the heap
+        :type pairs: iterable
+        :return: a new heap holding the pairs
+        :rtype: IndexedHeap
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap.from_iterable([('c', 3), ('a', 1), ('b', 2)])
+            >>> print(sample.pop(), sample.n)
+            ('a', 1) 2
+        """
+        heap = cls()
+        heap.push_many(pairs)
+        return heap
+
+    def push(self, item, priority):
+        """Inserts the item with the given priority in the heap and returns its handle.
+
+        :param item: the item to be inserted
+        :type item: any
+        :param priority: the priority of the item, smaller priorities come out first
+        :type priority: any
+        :return: the handle of the item
+        :rtype: HeapHandle
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> h = sample.push('b', 2)
+            >>> print(sample.push('a', 1).index, h.index)
+            0 1
+        """
+        handle = HeapHandle(item, priority)
+        Heap.insert(self, handle)
+        return handle
+
+    def insert(self, val):
+        """Inserts val in the heap with val itself as its priority.
+
+        :param val: the value to be inserted
+        :type val: any
+        """
+        self.push(val, val)
+
+    def push_many(self, pairs):
+        """Inserts all the given (item, priority) pairs in the heap and returns their handles in the same order.
+
+        :param pairs: the (item, priority) pairs to be inserted
+        :type pairs: iterable
+        :return: the handles of the items
+        :rtype: List
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> handles = sample.push_many([('x', 5), ('y', 4)])
+            >>> print([h.item for h in handles], sample.min().item)
+            ['x', 'y'] y
+        """
+        handles = [HeapHandle(item, priority) for item, priority in pairs]
+        for i, handle in enumerate(handles, self.n):
+            handle.index = i
+        Heap.push_many(self, handles)
+        return handles
+
+    def pop(self):
+        """Deletes the element with the smallest priority from the heap and returns it.
+
+        :return: the (item, priority) pair of the removed element
+        :rtype: tuple
+        :raises IndexError: if the heap is empty
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> h = sample.push('a', 1)
+            >>> print(sample.pop(), h in sample)
+            ('a', 1) False
+        """
+        handle = Heap.pop(self)
+        handle.index = None
+        return handle.item, handle.priority
+
+    def pop_many(self, k):
+        """Deletes the k elements with the smallest priorities (or all of them if there are fewer) and returns them in ascending order.
+
+        :param k: number of elements to remove
+        :type k: int
+        :return: the (item, priority) pairs of the removed elements
+        :rtype: List
+        """
+        pop = self.pop
+        return [pop() for _ in range(min(k, self.n))]
+
+    def decrease_key(self, handle, priority):
+        """Lowers the priority of the element of the given handle in O(log n).
+
+        :param handle: handle of an element in the heap
+        :type handle: HeapHandle
+        :param priority: the new priority, not larger than the current one
+        :type priority: any
+        :raises ValueError: if the handle is not in the heap or the priority is larger than the current one
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> a = sample.push('a', 1)
+            >>> b = sample.push('b', 5)
+            >>> sample.decrease_key(b, 0)
+            >>> print(sample.min().item, a.index, b.index)
+            b 1 0
+        """
+        if priority > handle.priority:
+            raise ValueError('new priority is larger than the current one')
+        self.update(handle, priority)
+
+    def update(self, handle, priority):
+        """Changes the priority of the element of the given handle to any value in O(log n).
+
+        :param handle: handle of an element in the heap
+        :type handle: HeapHandle
+        :param priority: the new priority
+        :type priority: any
+        :raises ValueError: if the handle is not in the heap
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> a = sample.push('a', 1)
+            >>> b = sample.push('b', 5)
+            >>> sample.update(a, 9)
+            >>> print(sample.pop_many(2))
+            [('b', 5), ('a', 9)]
+        """
+        if handle not in self:
+            raise ValueError('handle is not in the heap')
+        old = handle.priority
+        handle.priority = priority
+        if priority < old:
+            self._siftUp(handle.index)
+        else:
+            self.Heapify(handle.index)
+
+    def remove(self, handle):
+        """Deletes the element of the given handle from the heap in O(log n).
+
+        :param handle: handle of an element in the heap
+        :type handle: HeapHandle
+        :raises ValueError: if the handle is not in the heap
+
+        Example:
+            >>> from Heap import *
+            >>> sample = IndexedHeap()
+            >>> handles = sample.push_many([('a', 1), ('b', 2), ('c', 3)])
+            >>> sample.remove(handles[1])
+            >>> print(handles[1] in sample, sample.pop_many(3))
+            False [('a', 1), ('c', 3)]
+        """
+        if handle not in self:
+            raise ValueError('handle is not in the heap')
+        H = self.H
+        i = handle.index
+        self.n -= 1
+        last = H[self.n]
+        H[self.n] = None # release the last slot
+        handle.index = None
+        if last is not handle: # fill the gap with the last element
+            H[i] = last
+            last.index = i
+            if last.priority < handle.priority:
+                self._siftUp(i)
+            else:
+                self.Heapify(i)
+
+    def __contains__(self, handle):
+        """Checks if the element of the given handle is in the heap, in O(1).
+
+        :param handle: a handle returned by this heap
+        :type handle: HeapHandle
+        :return: True if found, else returns False
+        :rtype: bool
+        """
+        i = handle.index
+        return i != None and i < self.n and self.H[i] is handle
+
+    def _siftUp(self, i):
+        """Moves the handle at index i up by priority, keeping the index of every moved handle up to date."""
+        H = self.H
+        handle = H[i]
+        priority = handle.priority
+        while i != 0:
+            p = (i - 1) >> 1 # parent
+            parent = H[p]
+            if parent.priority > priority:
+                H[i] = parent
+                parent.index = i
+                i = p
+            else:
+                break
+        H[i] = handle
+        handle.index = i
+
+    def Heapify(self, root):
+        """Moves the handle at index root down by priority, keeping the index of every moved handle up to date.
+
+        :param root: index of the root element of the heap to be heapified
+        :type root: int
+        """
+        H = self.H
+        n = self.n
+        handle = H[root]
+        priority = handle.priority
+        i = root
+        l = 2 * i + 1
+        while l < n:
+            if l + 1 < n and H[l + 1].priority < H[l].priority: # right child is smaller
+                l += 1
+            child = H[l]
+            if child.priority < priority:
+                H[i] = child
+                child.index = i
+                i = l
+                l = 2 * i + 1
+            else:
+                break
+        H[i] = handle
+        handle.index = i
+
+# ----------------------------- Concurrent Heaps ------------------------------
+
+class ConcurrentHeap:
+    """This class is the implementation of a thread-safe blocking priority queue on top of a heap.
+    |br| Every operation holds one lock only while the heap is changed, and a consumer waiting in get() sleeps on a condition instead of polling,
+    being woken up individually when an element arrives.
+
+    This class has seven member functions of which one is the constructor:
+
+    - __init__(heap) is the constructor
+    - put(val)
+    - put_many(values)
+    - get(block, timeout)
+    - get_many(k, timeout)
+    - peek()
+    - __len__()
+
+    :param heap: This is the heap holding the elements, which should only be used through this object
+    :type heap: Heap
+    """
+
+    def __init__(self, heap = None):
+        """Constructor method for concurrent heap.
+        |br| This stores the given heap, or a new empty Heap, and creates the lock guarding it.
+
+        :param heap: the heap to hold the elements, such as a DaryHeap, defaults to a new Heap
+        :type heap: Heap, optional
+
+        Example:
+            >>> from Heap import *
+            >>> sample = ConcurrentHeap(DaryHeap(d = 4, reverse = True))
+            >>> sample.put_many([3, 7, 5])
+            >>> print(sample.get(), len(sample))
+            7 2
+        """
+        self.heap = Heap() if heap == None else heap
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.waiting = 0 # number of consumers sleeping on notEmpty
+
+    def put(self, val):
+        """Inserts val in the heap and wakes up one waiting consumer.
+
+        :param val: the value to be inserted
+        :type val: any
+        """
+        with self.lock:
+            self.heap.insert(val)
+            if self.waiting:
+                self.notEmpty.notify()
+
+    def put_many(self, values):
+        """Inserts all the given values in the heap under a single acquisition of the lock, and wakes up as many waiting consumers.
+
+        :param values: the values to be inserted
+        :type values: iterable
+        """
+        values = list(values)
+        with self.lock:
+            self.heap.push_many(values)
+            if self.waiting:
+                self.notEmpty.notify(len(values))
+
+    def get(self, block = True, timeout = None):
+        """Deletes the top element of the heap and returns it, waiting for one to arrive if the heap is empty.
+
+        :param block: tells if the call should wait for an element, defaults to True
+        :type block: bool, optional
+        :param timeout: longest time in seconds to wait, defaults to None to wait forever
+        :type timeout: float, optional
+        :return: the top element of the heap
+        :rtype: any
+        :raises queue.Empty: if no element arrived in time, or the heap is empty and block is False
+
+        Example:
+            >>> from Heap import *
+            >>> sample = ConcurrentHeap()
+            >>> sample.put(2)
+            >>> sample.put(1)
+            >>> print(sample.get(), sample.get())
+            1 2
+            >>> sample.get(timeout = 0.01) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+                ...
+            queue.Empty
+        """
+        with self.lock:
+            if not self.heap.n and (not block or not self._wait(timeout)):
+                raise queue.Empty
+            return self.heap.pop()
+
+    def get_many(self, k, timeout = None):
+        """Deletes up to k top elements of the heap under a single acquisition of the lock and returns them in order, waiting for at least one to arrive if the heap is empty.
+
+        :param k: largest number of elements to remove
+        :type k: int
+        :param timeout: longest time in seconds to wait, defaults to None to wait forever
+        :type timeout: float, optional
+        :return: the removed elements, top first
+        :rtype: List
+        :raises queue.Empty: if no element arrived in time
+
+        Example:
+            >>> from Heap import *
+            >>> sample = ConcurrentHeap()
+            >>> sample.put_many([4, 1, 3])
+            >>> print(sample.get_many(2), sample.get_many(2))
+            [1, 3] [4]
+        """
+        with self.lock:
+            if not self.heap.n and not self._wait(timeout):
+                raise queue.Empty
+            return self.heap.pop_many(k)
+
+    def _wait(self, timeout):
+        """Sleeps with the lock released until the heap is not empty or the timeout expires, and tells if the heap is not empty."""
+        self.waiting += 1
+        try:
+            return self.notEmpty.wait_for(lambda: self.heap.n, timeout)
+        finally:
+            self.waiting -= 1
+
+    def peek(self):
+        """Returns the top element of the heap without removing it.
+
+        :return: the top element of the heap
+        :rtype: any
+        :raises queue.Empty: if the heap is empty, as None or -1 could be real elements
+        """
+        with self.lock:
+            if not self.heap.n:
+                raise queue.Empty
+            return self.heap.H[0]
+
+    def __len__(self):
+        """Returns the number of elements in the heap."""
+        return self.heap.n
+
+class AsyncHeap:
+    """This class is the implementation of an asyncio priority queue on top of a heap.
+    |br| A consumer awaiting get() is suspended on a future until an element arrives, and put() wakes up only one of them.
+    An instance must be used from a single event loop; other threads can hand elements to it through loop.call_soon_threadsafe(sample.put, val).
+
+    This class has six member functions of which one is the constructor:
+
+    - __init__(heap) is the constructor
+    - put(val)
+    - put_many(values)
+    - get() is a coroutine
+    - get_nowait()
+    - __len__()
+
+    :param heap: This is the heap holding the elements, which should only be used through this object
+    :type heap: Heap
+    """
+
+    def __init__(self, heap = None):
+        """Constructor method for asyncio heap.
+        |br| This stores the given heap, or a new empty Heap, and an empty queue of waiting consumers.
+
+        :param heap: the heap to hold the elements, defaults to a new Heap
+        :type heap: Heap, optional
+
+        Example:
+            >>> import asyncio
+            >>> from Heap import *
+            >>> async def main():
+            ...     sample = AsyncHeap()
+            ...     consumer = asyncio.ensure_future(sample.get())
+            ...     await asyncio.sleep(0)
+            ...     sample.put_many([5, 2, 8])
+            ...     return await consumer, await sample.get()
+            >>> print(asyncio.run(main()))
+            (2, 5)
+        """
+        self.heap = Heap() if heap == None else heap
+        self.getters = deque() # futures of the waiting consumers
+
+    def _wakeup(self, k = 1):
+        """Wakes up to k waiting consumers."""
+        while k and self.getters:
+            getter = self.getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                k -= 1
+
+    def put(self, val):
+        """Inserts val in the heap and wakes up one waiting consumer.
+
+        :param val: the value to be inserted
+        :type val: any
+        """
+        self.heap.insert(val)
+        self._wakeup()
+
+    def put_many(self, values):
+        """Inserts all the given values in the heap and wakes up as many waiting consumers.
+
+        :param values: the values to be inserted
+        :type values: iterable
+        """
+        values = list(values)
+        self.heap.push_many(values)
+        self._wakeup(len(values))
+
+    async def get(self):
+        """Deletes the top element of the heap and returns it, suspending the caller until one arrives if the heap is empty.
+
+        :return: the top element of the heap
+        :rtype: any
+        """
+        while not self.heap.n:
+            getter = asyncio.get_running_loop().create_future()
+            self.getters.append(getter)
+            try:
+                await getter
+            except:
+                getter.cancel()
+                try:
+                    self.getters.remove(getter)
+                except ValueError: # already woken up, pass the element on
+                    if self.heap.n:
+                        self._wakeup()
+                raise
+        return self.heap.pop()
+
+    def get_nowait(self):
+        """Deletes the top element of the heap and returns it.
+
+        :return: the top element of the heap
+        :rtype: any
+        :raises asyncio.QueueEmpty: if the heap is empty
+        """
+        if not self.heap.n:
+            raise asyncio.QueueEmpty
+        return self.heap.pop()
+
+    def __len__(self):
+        """Returns the number of elements in the heap."""
+        return self.heap.n
+
+# ------------------------- Top-k and k-way merge -----------------------------
+
+def _nbest(k, iterable, key, largest):
+    """Returns the k largest or smallest values of iterable, keeping only a heap of k (key, index, value) entries."""
+    if k <= 0:
+        return []
+    heap = DaryHeap(reverse = not largest) # the worst kept entry is on top
+    it = iter(iterable)
+    sign = -1 if largest else 1 # earlier values win ties
+    for i, val in zip(range(k), it):
+        heap.insert((val if key == None else key(val), sign * i, val))
+    H = heap.H
+    K = heap.K
+    before = heap._before
+    for i, val in enumerate(it, k):
+        kx = val if key == None else key(val)
+        if before(H[0][0], kx): # better than the worst kept value
+            H[0] = K[0] = (kx, sign * i, val)
+            heap.Heapify(0)
+    out = heap.pop_many(k)
+    out.reverse()
+    return [entry[2] for entry in out]
+
+def nlargest(k, iterable, key = None):
+    """Returns the k largest values of iterable, largest first, in O(n log k) time and O(k) memory.
+    |br| Only a heap of the k best values seen so far is kept, and the key of every value is computed once. Of equal values, the earlier ones are returned first.
+
+    :param k: number of values required
+    :type k: int
+    :param iterable: the values, which may be an unbounded stream
+    :type iterable: iterable
+    :param key: function giving the key to compare the values by, defaults to None
+    :type key: function, optional
+    :return: the k largest values
+    :rtype: List
+
+    Example:
+        >>> from Heap import *
+        >>> print(nlargest(3, [5, 1, 8, 3, 9, 2]))
+        [9, 8, 5]
+        >>> print(nlargest(2, ['bb', 'a', 'cc', 'ddd'], key = len))
+        ['ddd', 'bb']
+    """
+    return _nbest(k, iterable, key, True)
+
+def nsmallest(k, iterable, key = None):
+    """Returns the k smallest values of iterable, smallest first, in O(n log k) time and O(k) memory.
+    |br| Only a heap of the k best values seen so far is kept, and the key of every value is computed once. Of equal values, the earlier ones are returned first.
+
+    :param k: number of values required
+    :type k: int
+    :param iterable: the values, which may be an unbounded stream
+    :type iterable: iterable
+    :param key: function giving the key to compare the values by, defaults to None
+    :type key: function, optional
+    :return: the k smallest values
+    :rtype: List
+
+    Example:
+        >>> from Heap import *
+        >>> print(nsmallest(3, [5, 1, 8, 3, 9, 2]))
+        [1, 2, 3]
+        >>> print(nsmallest(2, [-4, 3, -1, 2], key = abs))
+        [-1, 2]
+    """
+    return _nbest(k, iterable, key, False)
+
+def _values(source):
+    """Returns an iterator over the values of source, walking the nodes of a linked list from its head if it cannot be iterated directly."""
+    try:
+        return iter(source)
+    except TypeError:
+        if not hasattr(source, 'head'):
+            raise
+    def walk(node):
+        while node != None:
+            yield node.data
+            node = node.next
+    return walk(source.head)
+
+def kmerge(*sources, key = None):
+    """Lazily merges sorted sources into a single sorted stream, in O(n log k) time for k sources and O(k) memory.
+    |br| A source can be any sorted iterable, or a SinglyLinkedList whose nodes are then read directly. Of equal values, those of earlier sources come first.
+
+    :param sources: the sorted sources
+    :type sources: iterable or SinglyLinkedList
+    :param key: function giving the key the sources are sorted by, defaults to None
+    :type key: function, optional
+    :return: generator of the merged values
+    :rtype: generator
+
+    Example:
+        >>> from Heap import *
+        >>> from SinglyLinkedList import SinglyLinkedList
+        >>> sample = SinglyLinkedList()
+        >>> sample.insert(2)
+        >>> sample.insert(6)
+        >>> print(list(kmerge([1, 5, 9], sample, iter([3, 4]))))
+        [1, 2, 3, 4, 5, 6, 9]
+    """
+    entries = []
+    for i, source in enumerate(sources):
+        it = _values(source)
+        try:
+            val = next(it)
+        except StopIteration:
+            continue
+        entries.append((val if key == None else key(val), i, val, it))
+    heap = Heap.from_iterable(entries)
+    H = heap.H
+    while heap.n > 1:
+        entry = H[0]
+        yield entry[2]
+        it = entry[3]
+        try:
+            val = next(it)
+        except StopIteration: # source exhausted
+            heap.pop()
+            continue
+        H[0] = (val if key == None else key(val), entry[1], val, it)
+        heap.Heapify(0)
+    if heap.n: # a single source is left
+        yield H[0][2]
+        yield from H[0][3]
@@ -1,19 +1,24 @@
 """This module contains the implementation of abstract data type Singly Linked List.
     |br| To achieve that, a Singly Linked List node (SinglyLinkedListNode) class has been implemented as well.
-    |br| This module also contains a merge function useful for merging Singly linked lists.
+    |br| This module also contains a merge function useful for merging sorted Singly linked lists.
 """
+import collections
+import itertools
+
 # ------------------------------- Singly Linked List -----------------------------
 
 
 class SinglyLinkedListNode:
     """This is the class implementation of node for singly linked list.
     |br|  This node/object of this class has the property that it contains address of the next node in the list.
+    |br|  The attributes are declared in __slots__, so a node carries no per-instance __dict__.
 
     This class has one constructor and one convertor:
 
     - __init__(data) is the constructor, and
     - __str__() is the convertor.
     """
+    __slots__ = ('data', 'next')
     
     def __init__(self, data):
         """Constructor method for Singly linked list nodes. 
@@ -52,20 +57,48 @@ class SinglyLinkedListNode:
 class SinglyLinkedList:
     """This is the class implementation of singly linked list.
         |br| The object of this class is a singly linked list of which address of only the head is known and each node has the address of the next node.
+        |br| Optionally the list keeps a hash index from every value to its nodes, and from every node to the node in front of it, which makes find and deleteVal O(1) expected for hashable values.
+        |br| Optionally the list also keeps a pool of the nodes freed by deleteVal, which insert and extend reuse instead of allocating new nodes.
+        A node returned by find must then not be used after it is deleted, as it may be handed out again.
         
-        This class has six member functions of which one is a constructor:
+        This class has fourteen member functions of which one is a constructor:
 
-        - __init__() is the constructor
+        - __init__(indexed, poolSize) is the constructor
         - insert(data)
+        - extend(values)
+        - concat(other)
         - find(data)
         - deleteVal(data)
         - printer(sep)
         - reverse()
+        - sort(key, reverse)
+        - __len__()
+        - __iter__()
+        - __contains__(data)
+        - to_list()
+        - islice(start, stop, step)
+
+    :param n: This contains the number of nodes in the list
+    :type n: int
+    :param index: This maps every value in the list to a deque of the nodes holding it, in list order, or is None if the list is not indexed
+    :type index: dict
+    :param prevOf: This maps every node of the list to the node previous to it (None for the head), or is None if the list is not indexed
+    :type prevOf: dict
+    :param pool: This is the list of free nodes kept for reuse, or None if the list keeps no pool
+    :type pool: List
+    :param poolSize: This contains the largest number of free nodes kept in the pool
+    :type poolSize: int
     """
     
-    def __init__(self):
+    def __init__(self, indexed = False, poolSize = 0):
         """Constructor method for Singly Linked list.
-        |br| This sets the the head and tail of the list to None.
+        |br| This sets the the head and tail of the list to None, the number of nodes to zero, the index and prevOf to empty dictionaries if the list is indexed,
+        and the pool to an empty list if free nodes are to be kept.
+
+        :param indexed: tells if the list should keep a hash index of its values, defaults to False
+        :type indexed: bool, optional
+        :param poolSize: largest number of free nodes to keep for reuse, defaults to 0 for no pool
+        :type poolSize: int, optional
 
         Example: 
             >>> from SinglyLinkedList import *
@@ -73,10 +106,23 @@ class SinglyLinkedList:
             >>> print(sample.head)
             None
             >>> print(sample.tail)
-            None  
+            None
+            >>> print(sample.n)
+            0
+            >>> print(sample.index, SinglyLinkedList(indexed = True).index)
+            None {}
+            >>> print(sample.prevOf, SinglyLinkedList(indexed = True).prevOf)
+            None {}
+            >>> print(sample.pool, SinglyLinkedList(poolSize = 64).pool)
+            None []
         """
         self.head = None
         self.tail = None
+        self.n = 0
+        self.index = {} if indexed else None
+        self.prevOf = {} if indexed else None
+        self.pool = [] if poolSize > 0 else None
+        self.poolSize = poolSize
    
     def insert(self, data):
         """Inserts a new node which contains given data behind the tail of the list.
@@ -98,15 +144,150 @@ class SinglyLinkedList:
             >>> print(sample.tail.data)
             11
         """
-        node = SinglyLinkedListNode(data) # new node
+        if self.pool: # reuse a free node
+            node = self.pool.pop()
+            node.data = data
+        else:
+            node = SinglyLinkedListNode(data) # new node
+        if self.index != None:
+            nodes = self.index.get(data)
+            if nodes == None: # first occurrence
+                self.index[data] = collections.deque((node,))
+            else:
+                nodes.append(node)
+            self.prevOf[node] = self.tail
         if not self.head: # no head
             self.head = node
         else:
             self.tail.next = node # add behind tail
         self.tail = node # move tail
+        self.n += 1
+
+    def extend(self, values):
+        """Inserts new nodes containing the given values behind the tail of the list, building the chain of nodes in a single pass.
+        |br| Extending a list by itself copies its values first, and the list stays consistent even if the iterable raises part-way.
+
+        :param values: the information to be stored in the linked list
+        :type values: iterable
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.insert(1)
+            >>> sample.extend(range(2, 5))
+            >>> sample.printer()
+            [1, 2, 3, 4]
+            >>> print(sample.tail.data, len(sample))
+            4 4
+            >>> sample.extend(sample)
+            >>> sample.printer()
+            [1, 2, 3, 4, 1, 2, 3, 4]
+            >>> def failing():
+            ...     yield 5
+            ...     raise RuntimeError('source failed')
+            >>> sample.extend(failing())
+            Traceback (most recent call last):
+            ...
+            RuntimeError: source failed
+            >>> print(sample.tail.data, len(sample))
+            5 9
+        """
+        if values is self: # the loop would follow the nodes it appends
+            values = list(values)
+        index = self.index
+        prevOf = self.prevOf
+        pool = self.pool
+        tail = self.tail
+        count = 0
+        try:
+            for data in values:
+                if pool: # reuse a free node
+                    node = pool.pop()
+                    node.data = data
+                else:
+                    node = SinglyLinkedListNode(data)
+                if index != None:
+                    nodes = index.get(data)
+                    if nodes == None: # first occurrence
+                        index[data] = collections.deque((node,))
+                    else:
+                        nodes.append(node)
+                    prevOf[node] = tail
+                if tail == None: # no head
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+                count += 1
+        finally: # keep the nodes linked so far
+            self.tail = tail
+            self.n += count
+
+    def concat(self, other):
+        """Moves all the nodes of the other list behind the tail of this list, leaving the other list empty.
+        |br| The nodes are spliced in O(1) through the tail, without copying; only an indexed list also walks the values of the other list to update its index.
+
+        :param other: the list whose nodes are taken over
+        :type other: SinglyLinkedList
+        :raises ValueError: if other is this list itself
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample1 = SinglyLinkedList()
+            >>> sample2 = SinglyLinkedList()
+            >>> sample1.extend([1, 2])
+            >>> sample2.extend([3, 4])
+            >>> sample1.concat(sample2)
+            >>> sample1.printer()
+            [1, 2, 3, 4]
+            >>> sample2.printer()
+            []
+            >>> print(len(sample1), len(sample2), sample1.tail.data)
+            4 0 4
+        """
+        if other is self:
+            raise ValueError('cannot concatenate a list to itself')
+        if other.head == None:
+            return
+        index = self.index
+        if index != None: # add the nodes of other
+            prevOf = self.prevOf
+            if other.index != None:
+                for data, nodes in other.index.items():
+                    mine = index.get(data)
+                    if mine == None:
+                        index[data] = nodes
+                    else:
+                        mine.extend(nodes)
+                prevOf.update(other.prevOf)
+                prevOf[other.head] = self.tail
+            else:
+                prev = self.tail
+                ptr = other.head
+                while ptr != None:
+                    nodes = index.get(ptr.data)
+                    if nodes == None:
+                        index[ptr.data] = collections.deque((ptr,))
+                    else:
+                        nodes.append(ptr)
+                    prevOf[ptr] = prev
+                    prev = ptr
+                    ptr = ptr.next
+        if self.tail == None: # no head
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.n += other.n
+        other.head = other.tail = None # other gives up its nodes
+        other.n = 0
+        if other.index != None:
+            other.index = {}
+            other.prevOf = {}
     
     def find(self, data):
         """Finds the node with the data stored in it and returns the node previous to/in front of it.
+        |br| This is a single lookup in the index of an indexed list, and a walk from the head otherwise.
 
         :param data: It is the information we want to find in the linked list.
         :type data: any
@@ -125,6 +306,9 @@ class SinglyLinkedList:
             >>> print(mynode.next.data)
             22.5
         """
+        if self.index != None:
+            nodes = self.index.get(data)
+            return self.tail if nodes == None else self.prevOf[nodes[0]]
         head = self.head
         prev = None
         while head != None and head.data != data:
@@ -134,6 +318,7 @@ class SinglyLinkedList:
 
     def deleteVal(self, data):
         """Deletes the node containing data if found.
+        |br| In an indexed list the first occurrence comes off the deque of its value and its previous node from prevOf, so this is O(1) expected even with many copies.
 
         :param data: Data to be erased from the linked list.
         :type data: any
@@ -152,15 +337,55 @@ class SinglyLinkedList:
             >>> deletedTwice = sample.deleteVal("11")
             >>> print(deletedTwice)
             False
+            >>> indexed = SinglyLinkedList(indexed = True)
+            >>> for value in [1, 2, 1, 3]:
+            ...     indexed.insert(value)
+            >>> print(indexed.deleteVal(1), indexed.deleteVal(1), indexed.deleteVal(1))
+            True True False
+            >>> indexed.printer()
+            [2, 3]
+            >>> pooled = SinglyLinkedList(poolSize = 8)
+            >>> pooled.extend([1, 2, 3])
+            >>> freed = pooled.find(3).next
+            >>> print(pooled.deleteVal(3), len(pooled.pool))
+            True 1
+            >>> pooled.insert(4)
+            >>> print(pooled.tail is freed, len(pooled.pool))
+            True 0
         """
-        prevPos = self.find(data)
-        if prevPos.next == None:
-            return False
-        prevPos.next = prevPos.next.next
+        index = self.index
+        if index != None:
+            nodes = index.get(data)
+            if nodes == None:
+                return False
+            node = nodes.popleft() # first occurrence
+            if not nodes:
+                del index[data]
+            prevPos = self.prevOf.pop(node)
+        else:
+            prevPos = self.find(data)
+            node = prevPos.next if prevPos else self.head
+            if node == None or node.data != data:
+                return False
+        nextNode = node.next
+        if prevPos: # unlink the node
+            prevPos.next = nextNode
+        else:
+            self.head = nextNode
+        if node is self.tail:
+            self.tail = prevPos
+        node.next = None # release the node
+        self.n -= 1
+        if index != None and nextNode != None: # the next node lost its previous node
+            self.prevOf[nextNode] = prevPos
+        if self.pool != None and len(self.pool) < self.poolSize: # keep the node for reuse
+            node.data = None
+            self.pool.append(node)
         return True
     
     def printer(self, sep = ', '):
         """Prints the linked list.
+        |br| The whole list is joined into one string first, so it is written with a single print call.
 
         :param sep: This tells us what should be used as a separator for distinct elements while printing the list, defaults to ', '
         :type sep: str, optional
@@ -176,17 +401,101 @@ class SinglyLinkedList:
             >>> sample.printer('-> ')
             [10-> 11-> 22.5]
         """
+        print('[' + sep.join(map(str, self)) + ']')
+
+    def __len__(self):
+        """Returns the number of nodes in the list in O(1).
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.insert(10)
+            >>> sample.insert("11")
+            >>> print(len(sample))
+            2
+        """
+        return self.n
+
+    def __iter__(self):
+        """Returns a generator over the data of the nodes from the head to the tail.
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.insert(10)
+            >>> sample.insert("11")
+            >>> print([data for data in sample])
+            [10, '11']
+        """
         ptr = self.head
-        print('[', end = '')
         while ptr != None:
-            print(ptr, end = '')
+            yield ptr.data
             ptr = ptr.next
-            if ptr != None:
-                print(sep, end = '')
-        print(']')
+
+    def __contains__(self, data):
+        """Checks if data is stored in the list, with a single lookup if the list is indexed.
+
+        :param data: It is the information we want to find in the linked list.
+        :type data: any
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.insert(10)
+            >>> print(10 in sample, 11 in sample)
+            True False
+        """
+        if self.index != None:
+            return data in self.index
+        for value in self:
+            if value == data:
+                return True
+        return False
+
+    def to_list(self):
+        """Returns the data of the nodes as a Python list, from the head to the tail.
+
+        :return: data of the list
+        :rtype: List
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.insert(10)
+            >>> sample.insert(22.5)
+            >>> print(sample.to_list())
+            [10, 22.5]
+        """
+        return list(self)
+
+    def islice(self, start, stop = None, step = 1):
+        """Lazily yields the data of the nodes at positions start, start + step, ... before stop, like itertools.islice.
+        |br| Only the nodes up to the end of the window are visited.
+
+        :param start: position of the first node in the window
+        :type start: int
+        :param stop: position after the last node in the window, defaults to None for the end of the list
+        :type stop: int, optional
+        :param step: distance between the positions, defaults to 1
+        :type step: int, optional
+        :return: generator of the data in the window
+        :rtype: generator
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> for i in range(10):
+            ...     sample.insert(i)
+            >>> print(list(sample.islice(2, 5)), list(sample.islice(1, None, 3)))
+            [2, 3, 4] [1, 4, 7]
+        """
+        return itertools.islice(self, start, stop, step)
     
     def reverse(self):
         """Reverses the linked list.
+        |br| An indexed list rebuilds its index afterwards, in O(n) like the reversal itself.
 
         Example:
             >>> from SinglyLinkedList import *
@@ -209,9 +518,206 @@ class SinglyLinkedList:
             head = newHead # use extra pointer to move to next element
         self.tail = self.head
         self.head = prev
+        if self.index != None:
+            self._reindex()
+
+    def sort(self, key = None, reverse = False):
+        """Sorts the linked list in place by a stable bottom-up merge sort in O(n log n).
+        |br| The nodes are relinked without allocating new ones; runs of 1, 2, 4, ... nodes are merged pairwise until one run is left.
+        Without key this takes O(1) extra memory. As with list.sort, key is called once per node: the keys are computed up front
+        and kept in the nodes as (key, data) pairs for the length of the sort, which takes O(n) extra memory for the pairs and a list of the nodes.
+        |br| If a comparison raises, the nodes are linked back into one chain holding every value, in a partly sorted order, before the error is passed on.
+
+        :param key: function giving the key to sort the data by, defaults to None
+        :type key: function, optional
+        :param reverse: tells if the list should be sorted in descending order, defaults to False
+        :type reverse: bool, optional
+
+        Example:
+            >>> from SinglyLinkedList import *
+            >>> sample = SinglyLinkedList()
+            >>> sample.extend([5, 2, 9, 1, 7])
+            >>> sample.sort()
+            >>> sample.printer()
+            [1, 2, 5, 7, 9]
+            >>> print(sample.tail.data)
+            9
+            >>> sample.extend(['b', 'A', 'a', 'B'])
+            >>> sample.sort(key = str, reverse = True)
+            >>> sample.printer()
+            [b, a, B, A, 9, 7, 5, 2, 1]
+            >>> calls = []
+            >>> sample.sort(key = lambda data: calls.append(data) or str(data))
+            >>> print(len(calls), len(sample))
+            9 9
+            >>> mixed = SinglyLinkedList()
+            >>> mixed.extend([3, 1, 'a', 2, 5, 0])
+            >>> mixed.sort()
+            Traceback (most recent call last):
+            ...
+            TypeError: '<' not supported between instances of 'int' and 'str'
+            >>> print(sorted(mixed, key = str), len(mixed), mixed.tail.data)
+            [0, 1, 2, 3, 5, 'a'] 6 0
+        """
+        nodes = None
+        try:
+            if key != None: # decorate every node with its key once
+                nodes = []
+                ptr = self.head
+                while ptr != None:
+                    ptr.data = (key(ptr.data), ptr.data)
+                    nodes.append(ptr)
+                    ptr = ptr.next
+            head = self.head
+            tail = self.tail
+            width = 1
+            while width < self.n:
+                first = last = None # merged runs of this pass
+                ptr = head
+                while ptr != None:
+                    left = ptr
+                    right = _cut(left, width)
+                    ptr = _cut(right, width)
+                    try:
+                        runHead, runTail = _mergeRuns(left, right, nodes != None, reverse)
+                    except BaseException: # _mergeRuns left the two runs in one chain
+                        runHead = left
+                        while runHead != None and runHead is not right:
+                            runHead = runHead.next
+                        runHead = left if runHead is right else right
+                        self._relink(first, last, runHead, ptr)
+                        raise
+                    if last == None:
+                        first = runHead
+                    else:
+                        last.next = runHead
+                    last = runTail
+                head = first
+                tail = last
+                width *= 2
+            self.head = head
+            self.tail = tail
+        finally:
+            if nodes != None: # undecorate
+                for node in nodes:
+                    node.data = node.data[1]
+            if self.index != None:
+                self._reindex()
+
+    def _relink(self, first, last, run, rest):
+        """Links the merged runs from first to last, the chain from run and the unsorted chain from rest back into the list after a failed sort."""
+        if last == None:
+            first = run
+        else:
+            last.next = run
+        tail = first
+        while tail.next != None:
+            tail = tail.next
+        tail.next = rest
+        while tail.next != None:
+            tail = tail.next
+        self.head = first
+        self.tail = tail
+
+    def _reindex(self):
+        """Rebuilds the index and prevOf from the nodes of the list."""
+        index = {}
+        prevOf = {}
+        prev = None
+        ptr = self.head
+        while ptr != None:
+            nodes = index.get(ptr.data)
+            if nodes == None:
+                index[ptr.data] = collections.deque((ptr,))
+            else:
+                nodes.append(ptr)
+            prevOf[ptr] = prev
+            prev = ptr
+            ptr = ptr.next
+        self.index = index
+        self.prevOf = prevOf
+
+def _cut(node, k):
+    """Cuts the chain of nodes after the k-th node starting from node, and returns the first node after the cut."""
+    for _ in range(k - 1):
+        if node == None:
+            return None
+        node = node.next
+    if node == None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+def _mergeRuns(a, b, decorated = False, reverse = False):
+    """Relinks two sorted chains of nodes into one sorted chain, taking the node of a first on ties, and returns its head and tail nodes.
+    |br| The nodes of decorated chains hold (key, data) pairs and are compared by key alone.
+    If a comparison raises, the merged nodes, the rest of a and the rest of b are left linked in one chain starting at a or b.
+    """
+    head = tail = None
+    if a != None and b != None:
+        try:
+            if not decorated and not reverse: # compare the data directly
+                if b.data < a.data:
+                    head = tail = b
+                    b = b.next
+                else:
+                    head = tail = a
+                    a = a.next
+                while a != None and b != None:
+                    if b.data < a.data: # link node of b
+                        tail.next = b
+                        tail = b
+                        b = b.next
+                    else: # link node of a
+                        tail.next = a
+                        tail = a
+                        a = a.next
+            else:
+                ka = a.data[0] if decorated else a.data
+                kb = b.data[0] if decorated else b.data
+                while True:
+                    if (ka < kb) if reverse else (kb < ka): # link node of b
+                        node = b
+                        b = b.next
+                        if b != None:
+                            kb = b.data[0] if decorated else b.data
+                    else: # link node of a
+                        node = a
+                        a = a.next
+                        if a != None:
+                            ka = a.data[0] if decorated else a.data
+                    if tail == None:
+                        head = node
+                    else:
+                        tail.next = node
+                    tail = node
+                    if a == None or b == None:
+                        break
+        except BaseException: # leave the merged nodes, then the rest of a, then the rest of b in one chain
+            rest = a if a != None else b
+            if tail != None:
+                tail.next = rest
+            if a != None:
+                while a.next != None:
+                    a = a.next
+                a.next = b
+            raise
+    rest = a if a != None else b # one chain finished, add the other as is
+    if rest != None:
+        if tail == None:
+            head = rest
+        else:
+            tail.next = rest
+        while rest.next != None:
+            rest = rest.next
+        tail = rest
+    return head, tail
 
 def merge(list1, list2):
-    """Merges two Singly Linked Lists into a single Singly Linked List.
+    """Merges two sorted Singly Linked Lists into a single sorted Singly Linked List.
+    |br| The nodes of both lists are relinked into the merged list without being copied, so list1 and list2 are left empty.
+    Of equal values, the one from list1 comes first.
 
     :param list1: Singly linked list 1
     :type list1: SinglyLinkedList
@@ -219,6 +725,7 @@ def merge(list1, list2):
     :type list2: SinglyLinkedList
     :return: returns a singly linked list which is a combination of list1 and list2
     :rtype: SinglyLinkedList
+    :raises ValueError: if list1 and list2 are the same list
 
     Example:
         >>> from SinglyLinkedList import *
@@ -233,19 +740,20 @@ def merge(list1, list2):
         >>> sample = merge(sample1, sample2)
         >>> sample.printer()
         [9, 10, 11, 12, 13, 14]
+        >>> print(sample.tail.data, len(sample), len(sample1), sample2.head)
+        14 6 0 None
     """
-    merged = SinglyLinkedList()
-    head1 = list1.head
-    head2 = list2.head
-    while head1 != None and head2 != None: # both lists not empty
-        if head1.data < head2.data: # link node with smaller data
-            merged.insert(head1.data)
-            head1 = head1.next
-        else:
-            merged.insert(head2.data)
-            head2 = head2.next
-    if head1 == None and head2 != None: # list 1 finished
-        merged.tail.next = head2 # add remaining list 2 as is
-    if head1 != None and head2 == None: # list 2 finished
-        merged.tail.next = head1 # add remaining list 1 as is
-    return merged
\ No newline at end of file
+    if list1 is list2:
+        raise ValueError('cannot merge a list with itself')
+    merged = SinglyLinkedList(list1.index != None or list2.index != None)
+    merged.head, merged.tail = _mergeRuns(list1.head, list2.head)
+    merged.n = list1.n + list2.n
+    for source in (list1, list2): # the sources give up their nodes
+        source.head = source.tail = None
+        source.n = 0
+        if source.index != None:
+            source.index = {}
+            source.prevOf = {}
+    if merged.index != None:
+        merged._reindex()
+    return merged
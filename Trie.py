@@ -1,18 +1,30 @@
 """This module contains the implementation of abstract data type Suffix Trie.
+    |br| This module also contains a Suffix Automaton (SuffixAutomaton) class useful for substring queries on texts too long for a suffix trie, which needs O(n^2) nodes.
 """
+import collections
+import itertools
+
 # --------------------------------- Suffix Trie --------------------------------
 
 class Trie:
     """This is the class implementation of a Suffix Trie.
         |br| An instance of this class is a Trie which is used for the storage of various substrings of a string in the form of a tree with nodes where each node stores a character of the string.
 
-        This class has five member functions one of which is a constructor:
+        |br| build_suffixes inserts every suffix of a text, so that every substring of the text is a prefix in the trie;
+        every node it makes counts the suffixes through it under the key '##', and the end of the suffix starting at position i records i in a list under the key '$$'.
+        Both keys are two characters long, so they cannot clash with the one-character edges, not even with an edge for the character '#'.
+
+        This class has nine member functions one of which is a constructor:
 
         - __init__() is the constructor
         - find(root, c)
         - insert(s)
         - checkPrefix(s)
         - countPrefix(s)
+        - build_suffixes(text)
+        - contains_substring(p)
+        - count_occurrences(p)
+        - find_all_positions(p)
     """
     
     def __init__(self):
@@ -100,6 +112,7 @@ class Trie:
     
     def countPrefix(self, s):
         """Counts the number of prefixes of the string s in the Suffix Trie.
+        |br| Both the strings inserted by insert and the suffixes inserted by build_suffixes are counted.
 
         :param s: The string whose prefix count is required
         :type s: str
@@ -118,6 +131,10 @@ class Trie:
             4 3 2
             >>> print(sample.countPrefix('R'), sample.countPrefix('Tarzan'))
             1 0
+            >>> suffixes = Trie()
+            >>> suffixes.build_suffixes('banana')
+            >>> print(suffixes.countPrefix('an'), suffixes.countPrefix('a'))
+            2 3
         """
         found = True
         root = self.T
@@ -127,6 +144,323 @@ class Trie:
             else:
                 found = False
                 break
-        if found:
-            return root['#']
-        return 0
\ No newline at end of file
+        if found: # strings given to insert are counted under '#' and suffixes given to build_suffixes under '##'
+            return root.get('#', 0) + root.get('##', 0)
+        return 0
+
+    def build_suffixes(self, text):
+        """Inserts every suffix of the text, including the empty one, and records the position at which each suffix starts.
+        |br| The trie then answers substring queries on the text in time proportional to the pattern, but takes O(n^2) nodes,
+        so it is meant for short texts in an otherwise empty trie; SuffixAutomaton handles long ones.
+
+        :param text: the text whose suffixes are inserted
+        :type text: str
+
+        Example:
+            >>> from Trie import *
+            >>> sample = Trie()
+            >>> sample.build_suffixes('aba')
+            >>> print(sample.T['b'])
+            {'##': 1, 'a': {'##': 1, '$$': [1]}}
+            >>> print(sample.T['##'], sample.T['$$'], sample.T['a']['$$'])
+            4 [3] [2]
+            >>> mixed = Trie()
+            >>> mixed.insert('ab')
+            >>> mixed.build_suffixes('abc')
+            >>> print(mixed.countPrefix('ab'), mixed.count_occurrences('ab'), mixed.count_occurrences('bc'))
+            2 1 1
+            >>> hashed = Trie()
+            >>> hashed.build_suffixes('a#b#')
+            >>> print(hashed.count_occurrences('#'), hashed.find_all_positions('b#'), hashed.contains_substring('##'))
+            2 [2] False
+        """
+        T = self.T
+        T['##'] = T.get('##', 0) + len(text) + 1 # every suffix passes the root
+        T.setdefault('$$', []).append(len(text))
+        for i in range(len(text)):
+            root = T
+            for c in text[i:]:
+                if c not in root:
+                    root[c] = {}
+                root = root[c]
+                root['##'] = root.get('##', 0) + 1 # the node may have been made by insert
+            root.setdefault('$$', []).append(i)
+
+    def _walk(self, p):
+        """Returns the node reached by following the pattern p from the root along child nodes only, or None if it falls off the trie."""
+        root = self.T
+        for c in p:
+            root = root.get(c)
+            if not isinstance(root, dict): # missing, or a count made by insert
+                return None
+        return root
+
+    def contains_substring(self, p):
+        """Checks if the pattern p is a substring of the text given to build_suffixes.
+
+        :param p: the pattern to look for
+        :type p: str
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from Trie import *
+            >>> sample = Trie()
+            >>> sample.build_suffixes('banana')
+            >>> print(sample.contains_substring('nan'), sample.contains_substring('nab'), sample.contains_substring('#'))
+            True False False
+        """
+        return self._walk(p) != None
+
+    def count_occurrences(self, p):
+        """Counts the possibly overlapping occurrences of the pattern p in the text given to build_suffixes.
+
+        :param p: the pattern to count
+        :type p: str
+        :return: number of occurrences of p
+        :rtype: int
+
+        Example:
+            >>> from Trie import *
+            >>> sample = Trie()
+            >>> sample.build_suffixes('banana')
+            >>> print(sample.count_occurrences('ana'), sample.count_occurrences('a'), sample.count_occurrences('#'))
+            2 3 0
+        """
+        node = self._walk(p)
+        return 0 if node == None else node['##']
+
+    def find_all_positions(self, p):
+        """Finds the starting positions of all the possibly overlapping occurrences of the pattern p in the text given to build_suffixes.
+        |br| The positions are collected from the '$$' lists below the node of the pattern.
+
+        :param p: the pattern to look for
+        :type p: str
+        :return: the sorted starting positions of p
+        :rtype: List
+
+        Example:
+            >>> from Trie import *
+            >>> sample = Trie()
+            >>> sample.build_suffixes('banana')
+            >>> print(sample.find_all_positions('ana'), sample.find_all_positions('nab'), sample.find_all_positions('#'))
+            [1, 3] [] []
+            >>> print(sample.checkPrefix('anx'), sample.find_all_positions('an'))
+            False [1, 3]
+        """
+        node = self._walk(p)
+        if node == None:
+            return []
+        positions = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key == '$$':
+                    positions.extend(child)
+                elif len(key) == 1 and isinstance(child, dict): # an edge, not a count or a leaf made by checkPrefix
+                    stack.append(child)
+        positions.sort()
+        return positions
+
+# ------------------------------ Suffix Automaton ------------------------------
+
+class SuffixAutomaton:
+    """This is the class implementation of a Suffix Automaton.
+        |br| An instance of this class is the smallest automaton which accepts exactly the substrings of a text.
+        It is built online in O(n) time with at most 2n states, so substring queries on texts of several megabytes take time proportional to the pattern (plus the number of positions reported).
+        |br| The states are numbered from 0 (the empty string) and kept in parallel lists.
+
+        This class has five member functions one of which is a constructor:
+
+        - __init__(text) is the constructor
+        - extend(c)
+        - contains_substring(p)
+        - count_occurrences(p)
+        - find_all_positions(p)
+
+    :param next: This contains the transitions of every state, as a dictionary from a character to a state
+    :type next: List
+    :param link: This contains the suffix link of every state, -1 for the state 0
+    :type link: List
+    :param length: This contains the length of the longest string reaching every state
+    :type length: List
+    :param firstPos: This contains the position at which the first occurrence of the strings of every state ends
+    :type firstPos: List
+    :param isClone: This tells for every state if it was made by cloning another one
+    :type isClone: List
+    :param last: This is the state of the whole text read so far
+    :type last: int
+    """
+
+    def __init__(self, text = ''):
+        """Constructor method for Suffix Automaton.
+        |br| This creates the state of the empty string and then extends the automaton by every character of the text.
+
+        :param text: the text to build the automaton of, defaults to ''
+        :type text: str, optional
+
+        Example:
+            >>> from Trie import *
+            >>> sample = SuffixAutomaton('abb')
+            >>> print(len(sample.length), sample.length, sample.link)
+            5 [0, 1, 2, 3, 1] [-1, 0, 4, 4, 0]
+        """
+        self.next = [{}]
+        self.link = [-1]
+        self.length = [0]
+        self.firstPos = [-1]
+        self.isClone = [False]
+        self.last = 0
+        self._counts = None # occurrences of every state, made on demand
+        self._tree = None # states sorted by suffix link, made on demand
+        for c in text:
+            self.extend(c)
+
+    def extend(self, c):
+        """Appends the character c to the text of the automaton in amortized O(1).
+
+        :param c: the character to append
+        :type c: str
+
+        Example:
+            >>> from Trie import *
+            >>> sample = SuffixAutomaton('ab')
+            >>> print(sample.contains_substring('bc'))
+            False
+            >>> sample.extend('c')
+            >>> print(sample.contains_substring('bc'))
+            True
+        """
+        next, link, length = self.next, self.link, self.length
+        cur = len(length)
+        next.append({})
+        link.append(0)
+        length.append(length[self.last] + 1)
+        self.firstPos.append(length[cur] - 1)
+        self.isClone.append(False)
+        p = self.last
+        while p != -1 and c not in next[p]:
+            next[p][c] = cur
+            p = link[p]
+        if p != -1:
+            q = next[p][c]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else: # split q by cloning it
+                clone = len(length)
+                next.append(dict(next[q]))
+                link.append(link[q])
+                length.append(length[p] + 1)
+                self.firstPos.append(self.firstPos[q])
+                self.isClone.append(True)
+                while p != -1 and next[p].get(c) == q:
+                    next[p][c] = clone
+                    p = link[p]
+                link[q] = link[cur] = clone
+        self.last = cur
+        self._counts = self._tree = None
+
+    def _walk(self, p):
+        """Returns the state reached by reading the pattern p from the state 0, or None if there is no transition."""
+        next = self.next
+        state = 0
+        for c in p:
+            state = next[state].get(c)
+            if state == None:
+                return None
+        return state
+
+    def contains_substring(self, p):
+        """Checks if the pattern p is a substring of the text.
+
+        :param p: the pattern to look for
+        :type p: str
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from Trie import *
+            >>> sample = SuffixAutomaton('banana')
+            >>> print(sample.contains_substring('nan'), sample.contains_substring('nab'))
+            True False
+        """
+        return self._walk(p) != None
+
+    def count_occurrences(self, p):
+        """Counts the possibly overlapping occurrences of the pattern p in the text.
+        |br| The first call after the text changes counts the occurrences of every state once, in O(n).
+
+        :param p: the pattern to count
+        :type p: str
+        :return: number of occurrences of p
+        :rtype: int
+
+        Example:
+            >>> from Trie import *
+            >>> sample = SuffixAutomaton('banana')
+            >>> print(sample.count_occurrences('ana'), sample.count_occurrences('a'), sample.count_occurrences(''), sample.count_occurrences('x'))
+            2 3 7 0
+        """
+        state = self._walk(p)
+        if state == None:
+            return 0
+        if state == 0: # the empty string occurs at every position
+            return self.length[self.last] + 1
+        if self._counts == None:
+            length, link = self.length, self.link
+            counts = [0 if clone else 1 for clone in self.isClone]
+            starts = [0] * (length[self.last] + 2) # counting sort of the states by length
+            for l in length:
+                starts[l + 1] += 1
+            starts = list(itertools.accumulate(starts))
+            order = [0] * len(length)
+            for v, l in enumerate(length):
+                order[starts[l]] = v
+                starts[l] += 1
+            for v in reversed(order): # longer states pass their count up the suffix links
+                if v:
+                    counts[link[v]] += counts[v]
+            self._counts = counts
+        return self._counts[state]
+
+    def find_all_positions(self, p):
+        """Finds the starting positions of all the possibly overlapping occurrences of the pattern p in the text.
+        |br| Every occurrence ends at the first position of a state below the state of p in the tree of suffix links,
+        which is walked in time proportional to the number of occurrences.
+        The first call after the text changes sorts the states by suffix link once, in O(n log n), so that the children of every state are a slice.
+
+        :param p: the pattern to look for
+        :type p: str
+        :return: the sorted starting positions of p
+        :rtype: List
+
+        Example:
+            >>> from Trie import *
+            >>> sample = SuffixAutomaton('banana')
+            >>> print(sample.find_all_positions('ana'), sample.find_all_positions('nab'), sample.find_all_positions(''))
+            [1, 3] [] [0, 1, 2, 3, 4, 5, 6]
+        """
+        state = self._walk(p)
+        if state == None:
+            return []
+        if state == 0:
+            return list(range(self.length[self.last] + 1))
+        if self._tree == None:
+            link = self.link
+            states = sorted(range(1, len(link)), key = link.__getitem__)
+            sizes = collections.Counter(itertools.islice(link, 1, None)) # number of children of every state
+            starts = list(itertools.accumulate(map(sizes.__getitem__, range(len(link))), initial = 0))
+            self._tree = (starts, states)
+        starts, states = self._tree
+        firstPos, isClone = self.firstPos, self.isClone
+        shift = len(p) - 1
+        positions = []
+        stack = [state]
+        while stack:
+            v = stack.pop()
+            if not isClone[v]:
+                positions.append(firstPos[v] - shift)
+            stack.extend(states[starts[v]:starts[v + 1]])
+        positions.sort()
+        return positions
@@ -0,0 +1,320 @@
+"""This module contains the implementation of abstract data type Unrolled Linked List.
+    |br| To achieve that, an Unrolled Linked List node (UnrolledLinkedListNode) class has been implemented as well.
+    |br| An unrolled linked list keeps a chunk of up to capacity values in every node instead of a single value,
+    so it offers the same interface as a singly linked list with far fewer nodes, less memory per value and faster iteration.
+"""
+
+# ------------------------------- Unrolled Linked List -----------------------------
+
+
+class UnrolledLinkedListNode:
+    """This is the class implementation of node for unrolled linked list.
+    |br|  This node/object of this class has the property that it contains a chunk of values and the address of the next node in the list.
+
+    This class has one constructor and one convertor:
+
+    - __init__(data) is the constructor, and
+    - __str__() is the convertor.
+    """
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data = None):
+        """Constructor method for Unrolled linked list nodes.
+        |br| This sets the chunk to the given list of values (or an empty list) and next to none.
+
+        :param data: this is the list of values we want the node to contain, defaults to None for an empty chunk
+        :type data: List, optional
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedListNode([10, 11])
+            >>> print(sample.data, sample.next)
+            [10, 11] None
+        """
+        self.data = [] if data == None else data
+        self.next = None
+
+    def __str__(self):
+        """Convertor method for Unrolled linked list nodes.
+        |br| This returns the string form of the chunk stored in the node.
+
+        :return: string form of the chunk
+        :rtype: str
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedListNode([10, 11])
+            >>> print(sample.__str__())
+            [10, 11]
+        """
+        return str(self.data)
+
+class UnrolledLinkedList:
+    """This is the class implementation of unrolled linked list.
+        |br| The object of this class is a singly linked list of chunks, each holding at most capacity values.
+        Insertions fill the last node before starting a new one, and deleteVal refills a node that drops below half its capacity from the next node or merges the two,
+        so the nodes stay mostly full.
+
+        This class has ten member functions of which one is a constructor:
+
+        - __init__(capacity) is the constructor
+        - insert(data)
+        - extend(values)
+        - find(data)
+        - deleteVal(data)
+        - printer(sep)
+        - reverse()
+        - __len__()
+        - __iter__()
+        - __contains__(data)
+
+    :param n: This contains the number of values in the list
+    :type n: int
+    :param capacity: This contains the largest number of values kept in one node
+    :type capacity: int
+    """
+
+    def __init__(self, capacity = 64):
+        """Constructor method for Unrolled Linked list.
+        |br| This sets the head and tail of the list to None, the number of values to zero and the capacity of the nodes.
+
+        :param capacity: largest number of values kept in one node, defaults to 64
+        :type capacity: int, optional
+        :raises ValueError: if capacity is smaller than 2
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList()
+            >>> print(sample.head, sample.tail, sample.n, sample.capacity)
+            None None 0 64
+        """
+        if capacity < 2:
+            raise ValueError('capacity must be at least 2')
+        self.head = None
+        self.tail = None
+        self.n = 0
+        self.capacity = capacity
+
+    def insert(self, data):
+        """Inserts the given data behind the last value of the list, starting a new node when the tail is full.
+
+        :param data: It is the information to be stored in the linked list.
+        :type data: any
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 2)
+            >>> sample.insert(10)
+            >>> sample.insert("11")
+            >>> sample.insert(22.5)
+            >>> print(sample.head, sample.tail)
+            [10, '11'] [22.5]
+        """
+        tail = self.tail
+        if tail == None: # no head
+            self.head = self.tail = UnrolledLinkedListNode([data])
+        elif len(tail.data) < self.capacity:
+            tail.data.append(data)
+        else: # tail is full
+            tail.next = self.tail = UnrolledLinkedListNode([data])
+        self.n += 1
+
+    def extend(self, values):
+        """Inserts the given values behind the last value of the list, filling the tail and then whole new nodes by slicing.
+
+        :param values: the information to be stored in the linked list
+        :type values: iterable
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 3)
+            >>> sample.insert(1)
+            >>> sample.extend(range(2, 8))
+            >>> print(sample.head, sample.head.next, sample.tail, len(sample))
+            [1, 2, 3] [4, 5, 6] [7] 7
+        """
+        values = list(values)
+        capacity = self.capacity
+        start = 0
+        tail = self.tail
+        if tail != None: # fill the tail first
+            start = capacity - len(tail.data)
+            tail.data.extend(values[:start])
+        for pos in range(start, len(values), capacity):
+            node = UnrolledLinkedListNode(values[pos:pos + capacity])
+            if tail == None: # no head
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+        self.tail = tail
+        self.n += len(values)
+
+    def find(self, data):
+        """Finds the first occurrence of data and returns the node holding it together with its position in the chunk of that node.
+
+        :param data: It is the information we want to find in the linked list.
+        :type data: any
+        :return: the node and the position of data in it, or None if data is not in the list
+        :rtype: tuple
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 2)
+            >>> sample.extend([10, "11", 22.5])
+            >>> node, pos = sample.find(22.5)
+            >>> print(node.data[pos], pos)
+            22.5 0
+            >>> print(sample.find(7))
+            None
+        """
+        ptr = self.head
+        while ptr != None:
+            if data in ptr.data: # scans the chunk at C speed
+                return ptr, ptr.data.index(data)
+            ptr = ptr.next
+        return None
+
+    def deleteVal(self, data):
+        """Deletes the first occurrence of data if found.
+        |br| A node left less than half full takes values from the next node, or is merged with it when both fit in one node.
+
+        :param data: Data to be erased from the linked list.
+        :type data: any
+        :return: returns True if deleted successfully, else returns False if data not found in the list.
+        :rtype: bool
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 4)
+            >>> sample.extend(range(10))
+            >>> print(sample.head, sample.head.next, sample.tail)
+            [0, 1, 2, 3] [4, 5, 6, 7] [8, 9]
+            >>> print(sample.deleteVal(1), sample.deleteVal(2), sample.deleteVal(2))
+            True True False
+            >>> print(sample.head, sample.head.next, sample.tail)
+            [0, 3] [4, 5, 6, 7] [8, 9]
+            >>> print(sample.deleteVal(3))
+            True
+            >>> print(sample.head, sample.head.next, sample.tail)
+            [0, 4] [5, 6, 7] [8, 9]
+            >>> print(sample.deleteVal(5), sample.deleteVal(6))
+            True True
+            >>> print(sample.head, sample.tail)
+            [0, 4] [7, 8, 9]
+        """
+        prev = None
+        ptr = self.head
+        while ptr != None and data not in ptr.data:
+            prev = ptr
+            ptr = ptr.next
+        if ptr == None:
+            return False
+        chunk = ptr.data
+        chunk.remove(data)
+        self.n -= 1
+        half = self.capacity // 2
+        nextNode = ptr.next
+        if len(chunk) < half and nextNode != None:
+            if len(chunk) + len(nextNode.data) <= self.capacity: # merge the next node in
+                chunk.extend(nextNode.data)
+                ptr.next = nextNode.next
+                if nextNode is self.tail:
+                    self.tail = ptr
+            else: # borrow from the next node, which keeps at least half
+                take = half - len(chunk)
+                chunk.extend(nextNode.data[:take])
+                del nextNode.data[:take]
+        elif not chunk: # last node became empty
+            if prev == None:
+                self.head = None
+            else:
+                prev.next = None
+            self.tail = prev
+        return True
+
+    def printer(self, sep = ', '):
+        """Prints the linked list.
+
+        :param sep: This tells us what should be used as a separator for distinct elements while printing the list, defaults to ', '
+        :type sep: str, optional
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList()
+            >>> sample.extend([10, "11", 22.5])
+            >>> sample.printer()
+            [10, 11, 22.5]
+            >>> sample.printer('-> ')
+            [10-> 11-> 22.5]
+        """
+        print('[' + sep.join(map(str, self)) + ']')
+
+    def reverse(self):
+        """Reverses the linked list by reversing the order of the nodes and the chunk of every node in place.
+        |br| A short last node moves to the front, so the head may now be the node that is less than half full.
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 2)
+            >>> sample.extend([10, "11", 22.5])
+            >>> sample.reverse()
+            >>> sample.printer()
+            [22.5, 11, 10]
+            >>> print(sample.head, sample.tail)
+            [22.5] ['11', 10]
+        """
+        head = self.head
+        prev = None
+        while head != None:
+            head.data.reverse()
+            newHead = head.next
+            head.next = prev
+            prev = head
+            head = newHead
+        self.tail = self.head
+        self.head = prev
+
+    def __len__(self):
+        """Returns the number of values in the list in O(1).
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList()
+            >>> sample.extend([10, "11"])
+            >>> print(len(sample))
+            2
+        """
+        return self.n
+
+    def __iter__(self):
+        """Returns a generator over the values from the head to the tail, one chunk at a time.
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList(capacity = 2)
+            >>> sample.extend([10, "11", 22.5])
+            >>> print([data for data in sample])
+            [10, '11', 22.5]
+        """
+        ptr = self.head
+        while ptr != None:
+            yield from ptr.data
+            ptr = ptr.next
+
+    def __contains__(self, data):
+        """Checks if data is stored in the list.
+
+        :param data: It is the information we want to find in the linked list.
+        :type data: any
+        :return: True if found, else returns False
+        :rtype: bool
+
+        Example:
+            >>> from UnrolledLinkedList import *
+            >>> sample = UnrolledLinkedList()
+            >>> sample.extend([10, "11"])
+            >>> print(10 in sample, 11 in sample)
+            True False
+        """
+        return self.find(data) != None